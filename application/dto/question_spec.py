@@ -0,0 +1,16 @@
+from dataclasses import dataclass
+from domain.value_objects.types import QuestionType
+
+
+@dataclass(frozen=True, slots=True)
+class QuestionSpec:
+    """추가할 질문의 입력값을 나타내는 DTO입니다.
+
+    Attributes:
+        text: 질문 내용
+        question_type: 질문 유형
+        options: 객관식 선택지 (객관식인 경우)
+    """
+    text: str
+    question_type: QuestionType
+    options: tuple[str, ...] | None = None
@@ -0,0 +1,13 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True, slots=True)
+class ResponseSubmission:
+    """한 응답자가 제출하는 응답의 입력값을 나타내는 DTO입니다.
+
+    Attributes:
+        respondent_id: 응답자 식별자
+        answers: 질문 ID와 답변의 딕셔너리
+    """
+    respondent_id: str
+    answers: dict[str, str]
@@ -0,0 +1,13 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True, slots=True)
+class SurveySpec:
+    """생성할 설문의 입력값을 나타내는 DTO입니다.
+
+    Attributes:
+        title: 설문 제목
+        description: 설문 설명
+    """
+    title: str
+    description: str
@@ -1,17 +1,36 @@
+import copy
 import uuid
+from dataclasses import dataclass
 from datetime import datetime
 from collections import Counter
+from application.dto.response_submission import ResponseSubmission
+from domain.entities.question import Question
 from domain.entities.response import Response
 from domain.repositories.response_repository import ResponseRepository
 from domain.repositories.survey_repository import SurveyRepository
 
 
+@dataclass(frozen=True, slots=True)
+class CachedResults:
+    """캐시된 설문 결과를 나타냅니다.
+
+    Attributes:
+        revision: 결과를 계산할 때의 응답 저장소 버전
+        questions: 결과를 계산할 때의 질문 목록
+        results: 질문 ID별 결과 통계
+    """
+    revision: str
+    questions: tuple[Question, ...]
+    results: dict[str, dict[str, int | float | list[str]]]
+
+
 class ResponseService:
     """응답 관련 유스케이스를 처리하는 서비스입니다.
 
     Attributes:
         response_repository: 응답 저장소
         survey_repository: 설문 저장소
+        results_cache: 설문 ID별 결과 캐시
     """
 
     def __init__(self, response_repository: ResponseRepository, survey_repository: SurveyRepository):
@@ -23,6 +42,7 @@ class ResponseService:
         """
         self.response_repository = response_repository
         self.survey_repository = survey_repository
+        self.results_cache: dict[str, CachedResults] = {}
 
     def submit_response(self, survey_id: str, respondent_id: str, answers: dict[str, str]) -> None:
         """설문 응답을 제출합니다.
@@ -35,25 +55,44 @@ class ResponseService:
         Raises:
             ValueError: 설문을 찾을 수 없는 경우
         """
-        survey = self.survey_repository.find_survey_by_id(survey_id)
-        if not survey:
+        self.submit_responses(survey_id, [ResponseSubmission(respondent_id=respondent_id, answers=answers)])
+
+    def submit_responses(self, survey_id: str, submissions: list[ResponseSubmission]) -> None:
+        """여러 응답자의 응답을 한 번에 제출합니다.
+
+        설문 존재 여부를 한 번만 확인하고 모든 답변을 저장소에 한 번에 저장합니다.
+
+        Args:
+            survey_id: 설문 식별자
+            submissions: 응답자별 응답 입력값 목록
+
+        Raises:
+            ValueError: 설문을 찾을 수 없는 경우
+        """
+        if not self.survey_repository.exists_survey(survey_id):
             raise ValueError(f"설문을 찾을 수 없습니다: {survey_id}")
 
-        for question_id, answer in answers.items():
-            response_id = str(uuid.uuid4())
-            response = Response(
-                id=response_id,
+        created_at = datetime.now()
+        responses = [
+            Response(
+                id=uuid.uuid4().hex,
                 survey_id=survey_id,
                 question_id=question_id,
                 answer=answer,
-                respondent_id=respondent_id,
-                created_at=datetime.now(),
+                respondent_id=submission.respondent_id,
+                created_at=created_at,
             )
-            self.response_repository.save(response)
+            for submission in submissions
+            for question_id, answer in submission.answers.items()
+        ]
+        self.response_repository.save_many(responses)
 
     def get_survey_results(self, survey_id: str) -> dict[str, dict[str, int | float | list[str]]]:
         """설문 결과를 조회합니다.
 
+        응답 저장소 버전과 질문 목록이 바뀌지 않았으면 캐시된 결과를 반환합니다.
+        호출하는 쪽이 결과를 수정해도 캐시가 바뀌지 않도록 항상 깊은 복사본을 반환합니다.
+
         Args:
             survey_id: 설문 식별자
 
@@ -67,10 +106,15 @@ class ResponseService:
         if not survey:
             raise ValueError(f"설문을 찾을 수 없습니다: {survey_id}")
 
+        revision = self.response_repository.get_revision()
+        cached = self.results_cache.get(survey_id)
+        if cached and cached.revision == revision and cached.questions == survey.questions:
+            return copy.deepcopy(cached.results)
+
+        answers_by_question = self.response_repository.find_answers_by_survey_id(survey_id)
         results = {}
         for question in survey.questions:
-            responses = self.response_repository.find_by_question_id(question.id)
-            answers = [r.answer for r in responses]
+            answers = answers_by_question.get(question.id, [])
 
             if question.question_type.value == "rating":
                 ratings = [int(a) for a in answers if a.isdigit()]
@@ -97,4 +141,5 @@ class ResponseService:
                     "answers": answers,
                 }
 
-        return results
+        self.results_cache[survey_id] = CachedResults(revision=revision, questions=survey.questions, results=results)
+        return copy.deepcopy(results)
@@ -1,9 +1,19 @@
 import uuid
+from dataclasses import dataclass
 from datetime import datetime
+from typing import ClassVar
 from domain.entities.survey import Survey
 from domain.entities.question import Question
+from domain.value_objects.survey_page import SurveyPage
 from domain.value_objects.types import QuestionType
 from domain.repositories.survey_repository import SurveyRepository
+from application.dto.question_spec import QuestionSpec
+from application.dto.survey_spec import SurveySpec
+
+
+@dataclass(frozen=True, slots=True)
+class SurveyPageConfig:
+    MAX_LIMIT: ClassVar[int] = 50
 
 
 class SurveyService:
@@ -31,16 +41,32 @@ class SurveyService:
         Returns:
             생성된 설문의 ID
         """
-        survey_id = str(uuid.uuid4())
-        survey = Survey(
-            id=survey_id,
-            title=title,
-            description=description,
-            created_at=datetime.now(),
-            questions=(),
-        )
-        self.survey_repository.save_survey(survey)
-        return survey_id
+        return self.create_surveys([SurveySpec(title=title, description=description)])[0]
+
+    def create_surveys(self, specs: list[SurveySpec]) -> list[str]:
+        """여러 설문을 한 번에 생성합니다.
+
+        모든 설문 엔티티를 만든 뒤 저장소에 한 번에 저장합니다.
+
+        Args:
+            specs: 생성할 설문 입력값 목록
+
+        Returns:
+            생성된 설문 ID 목록 (입력 순서 유지)
+        """
+        created_at = datetime.now()
+        surveys = [
+            Survey(
+                id=str(uuid.uuid4()),
+                title=spec.title,
+                description=spec.description,
+                created_at=created_at,
+                questions=(),
+            )
+            for spec in specs
+        ]
+        self.survey_repository.save_surveys(surveys)
+        return [survey.id for survey in surveys]
 
     def add_question(
         self, survey_id: str, text: str, question_type: QuestionType, options: list[str] | None = None
@@ -59,20 +85,39 @@ class SurveyService:
         Raises:
             ValueError: 설문을 찾을 수 없는 경우
         """
-        survey = self.survey_repository.find_survey_by_id(survey_id)
-        if not survey:
+        spec = QuestionSpec(text=text, question_type=question_type, options=tuple(options) if options else None)
+        return self.add_questions(survey_id, [spec])[0]
+
+    def add_questions(self, survey_id: str, specs: list[QuestionSpec]) -> list[str]:
+        """설문에 여러 질문을 한 번에 추가합니다.
+
+        모든 질문을 먼저 검증한 뒤 저장소에 한 번에 저장합니다.
+
+        Args:
+            survey_id: 설문 식별자
+            specs: 추가할 질문 입력값 목록
+
+        Returns:
+            생성된 질문 ID 목록 (입력 순서 유지)
+
+        Raises:
+            ValueError: 설문을 찾을 수 없거나 질문이 유효하지 않은 경우
+        """
+        if not self.survey_repository.exists_survey(survey_id):
             raise ValueError(f"설문을 찾을 수 없습니다: {survey_id}")
 
-        question_id = str(uuid.uuid4())
-        question = Question(
-            id=question_id,
-            survey_id=survey_id,
-            text=text,
-            question_type=question_type,
-            options=tuple(options) if options else None,
-        )
-        self.survey_repository.save_question(question)
-        return question_id
+        questions = [
+            Question(
+                id=str(uuid.uuid4()),
+                survey_id=survey_id,
+                text=spec.text,
+                question_type=spec.question_type,
+                options=spec.options,
+            )
+            for spec in specs
+        ]
+        self.survey_repository.save_questions(questions)
+        return [question.id for question in questions]
 
     def get_survey(self, survey_id: str) -> Survey:
         """설문을 조회합니다.
@@ -98,3 +143,24 @@ class SurveyService:
             설문 엔티티 목록
         """
         return self.survey_repository.find_all_surveys()
+
+    def get_surveys(self, skip: int, limit: int) -> SurveyPage:
+        """설문 목록의 한 페이지와 전체 설문 수를 조회합니다.
+
+        limit은 SurveyPageConfig.MAX_LIMIT을 넘지 않도록 제한합니다.
+
+        Args:
+            skip: 건너뛸 설문 수 (0 이상)
+            limit: 조회할 최대 설문 수 (1 이상)
+
+        Returns:
+            설문 페이지와 전체 설문 수
+
+        Raises:
+            ValueError: skip이 음수이거나 limit이 1보다 작은 경우
+        """
+        if skip < 0:
+            raise ValueError(f"건너뛸 설문 수는 0 이상이어야 합니다: {skip}")
+        if limit < 1:
+            raise ValueError(f"조회할 설문 수는 1 이상이어야 합니다: {limit}")
+        return self.survey_repository.find_surveys(skip, min(limit, SurveyPageConfig.MAX_LIMIT))
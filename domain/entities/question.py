@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from domain.entities.restore import restore_entity
 from domain.value_objects.types import QuestionType
 
 
@@ -58,14 +59,18 @@ class Question:
 
         Returns:
             Question 엔티티 인스턴스
+
+        Raises:
+            ValueError: 질문 유형이 올바르지 않거나 필드가 빠진 경우
         """
         options_str = data.get("options", "")
         options = tuple(options_str.split("|")) if options_str else None
 
-        return cls(
+        return restore_entity(
+            cls,
             id=data["id"],
             survey_id=data["survey_id"],
             text=data["text"],
-            question_type=QuestionType(data["question_type"]),
+            question_type=QuestionType.from_value(data["question_type"]),
             options=options,
         )
@@ -1,5 +1,6 @@
 from dataclasses import dataclass
 from datetime import datetime
+from domain.entities.restore import restore_entity
 
 
 @dataclass(frozen=True, slots=True)
@@ -62,8 +63,12 @@ class Response:
 
         Returns:
             Response 엔티티 인스턴스
+
+        Raises:
+            ValueError: 생성 일시 형식이 올바르지 않거나 필드가 빠진 경우
         """
-        return cls(
+        return restore_entity(
+            cls,
             id=data["id"],
             survey_id=data["survey_id"],
             question_id=data["question_id"],
@@ -0,0 +1,47 @@
+from dataclasses import fields
+from functools import cache
+from typing import Any
+
+
+@cache
+def _field_names(entity_class: type) -> frozenset[str]:
+    """엔티티 클래스의 필드 이름 집합을 조회합니다.
+
+    Args:
+        entity_class: 엔티티 클래스 (dataclass)
+
+    Returns:
+        필드 이름 집합
+    """
+    return frozenset(field.name for field in fields(entity_class))
+
+
+def restore_entity[EntityT](entity_class: type[EntityT], **values: Any) -> EntityT:
+    """저장소에서 읽은 값으로 불변 엔티티를 검증 없이 복원합니다.
+
+    __init__과 __post_init__을 거치지 않으므로, 이미 검증되어 저장된
+    데이터를 다시 읽을 때만 사용해야 합니다. 필드가 빠지거나 남으면
+    일부만 채워진 엔티티를 만들지 않고 예외를 발생시킵니다.
+
+    Args:
+        entity_class: 복원할 엔티티 클래스 (frozen dataclass)
+        **values: 모든 필드의 값
+
+    Returns:
+        복원된 엔티티 인스턴스
+
+    Raises:
+        ValueError: 필드 값이 빠졌거나 알 수 없는 필드가 있는 경우
+    """
+    field_names = _field_names(entity_class)
+    if values.keys() != field_names:
+        missing = sorted(field_names - values.keys())
+        unknown = sorted(values.keys() - field_names)
+        raise ValueError(
+            f"{entity_class.__name__} 엔티티를 복원할 수 없습니다: 누락된 필드 {missing}, 알 수 없는 필드 {unknown}"
+        )
+
+    entity = object.__new__(entity_class)
+    for name, value in values.items():
+        object.__setattr__(entity, name, value)
+    return entity
@@ -1,6 +1,7 @@
 from dataclasses import dataclass
 from datetime import datetime
 from domain.entities.question import Question
+from domain.entities.restore import restore_entity
 
 
 @dataclass(frozen=True, slots=True)
@@ -56,8 +57,12 @@ class Survey:
 
         Returns:
             Survey 엔티티 인스턴스
+
+        Raises:
+            ValueError: 생성 일시 형식이 올바르지 않거나 필드가 빠진 경우
         """
-        return cls(
+        return restore_entity(
+            cls,
             id=data["id"],
             title=data["title"],
             description=data["description"],
@@ -15,25 +15,33 @@ class ResponseRepository(ABC):
         pass
 
     @abstractmethod
-    def find_by_survey_id(self, survey_id: str) -> list[Response]:
-        """설문 ID로 응답 목록을 조회합니다.
+    def save_many(self, responses: list[Response]) -> None:
+        """여러 응답을 한 번에 저장합니다.
+
+        Args:
+            responses: 저장할 응답 엔티티 목록
+        """
+        pass
+
+    @abstractmethod
+    def find_answers_by_survey_id(self, survey_id: str) -> dict[str, list[str]]:
+        """설문 ID로 답변을 질문 ID별로 묶어 조회합니다.
 
         Args:
             survey_id: 설문 식별자
 
         Returns:
-            응답 엔티티 목록
+            질문 ID별 답변 목록 (저장 순서 유지)
         """
         pass
 
     @abstractmethod
-    def find_by_question_id(self, question_id: str) -> list[Response]:
-        """질문 ID로 응답 목록을 조회합니다.
+    def get_revision(self) -> str:
+        """저장된 응답의 변경 버전을 조회합니다.
 
-        Args:
-            question_id: 질문 식별자
+        응답이 저장되거나 외부에서 변경되면 다른 값을 반환합니다.
 
         Returns:
-            응답 엔티티 목록
+            변경 여부를 판별하는 버전 문자열
         """
         pass
@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
 from domain.entities.survey import Survey
 from domain.entities.question import Question
+from domain.value_objects.survey_page import SurveyPage
 
 
 class SurveyRepository(ABC):
@@ -15,6 +16,15 @@ class SurveyRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    def save_surveys(self, surveys: list[Survey]) -> None:
+        """여러 설문을 한 번에 저장합니다.
+
+        Args:
+            surveys: 저장할 설문 엔티티 목록
+        """
+        pass
+
     @abstractmethod
     def save_question(self, question: Question) -> None:
         """질문을 저장합니다.
@@ -24,6 +34,15 @@ class SurveyRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    def save_questions(self, questions: list[Question]) -> None:
+        """여러 질문을 한 번에 저장합니다.
+
+        Args:
+            questions: 저장할 질문 엔티티 목록
+        """
+        pass
+
     @abstractmethod
     def find_survey_by_id(self, survey_id: str) -> Survey | None:
         """ID로 설문을 조회합니다.
@@ -36,6 +55,18 @@ class SurveyRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    def exists_survey(self, survey_id: str) -> bool:
+        """ID에 해당하는 설문이 있는지 확인합니다.
+
+        Args:
+            survey_id: 설문 식별자
+
+        Returns:
+            설문이 있으면 True, 없으면 False
+        """
+        pass
+
     @abstractmethod
     def find_all_surveys(self) -> list[Survey]:
         """모든 설문을 조회합니다.
@@ -45,6 +76,19 @@ class SurveyRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    def find_surveys(self, offset: int, limit: int) -> SurveyPage:
+        """저장 순서 기준으로 설문 일부와 전체 설문 수를 함께 조회합니다.
+
+        Args:
+            offset: 건너뛸 설문 수 (0 이상)
+            limit: 조회할 최대 설문 수 (1 이상)
+
+        Returns:
+            같은 시점의 설문 페이지와 전체 설문 수
+        """
+        pass
+
     @abstractmethod
     def find_questions_by_survey_id(self, survey_id: str) -> list[Question]:
         """설문 ID로 질문 목록을 조회합니다.
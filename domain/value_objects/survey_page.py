@@ -0,0 +1,14 @@
+from dataclasses import dataclass
+from domain.entities.survey import Survey
+
+
+@dataclass(frozen=True, slots=True)
+class SurveyPage:
+    """설문 목록의 한 페이지와 같은 시점의 전체 설문 수를 나타내는 값 객체입니다.
+
+    Attributes:
+        surveys: 페이지에 포함된 설문 목록 (저장 순서)
+        total: 전체 설문 수
+    """
+    surveys: tuple[Survey, ...]
+    total: int
@@ -12,3 +12,26 @@ class QuestionType(Enum):
     TEXT = "text"
     RATING = "rating"
     MULTIPLE_CHOICE = "choice"
+
+    @classmethod
+    def from_value(cls, value: str) -> "QuestionType":
+        """문자열 값으로 질문 유형을 조회합니다.
+
+        Enum 생성자 호출 대신 미리 만든 딕셔너리를 조회합니다.
+
+        Args:
+            value: 질문 유형 문자열 (text/rating/choice)
+
+        Returns:
+            질문 유형
+
+        Raises:
+            ValueError: 지원하지 않는 질문 유형인 경우
+        """
+        try:
+            return _QUESTION_TYPE_BY_VALUE[value]
+        except KeyError:
+            raise ValueError(f"지원하지 않는 질문 유형입니다: {value}") from None
+
+
+_QUESTION_TYPE_BY_VALUE: dict[str, QuestionType] = {question_type.value: question_type for question_type in QuestionType}
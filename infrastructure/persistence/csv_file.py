@@ -0,0 +1,58 @@
+import csv
+import io
+from collections.abc import Iterable, Sequence
+from pathlib import Path
+from typing import TextIO
+from infrastructure.persistence.file_signature import file_signature
+
+
+def open_csv(path: Path, mode: str) -> TextIO:
+    """CSV 저장소가 공통으로 사용하는 설정으로 파일을 엽니다.
+
+    csv 모듈 권장대로 newline=""로 열어 따옴표 안의 줄바꿈을 보존하고,
+    엑셀 호환을 위해 BOM이 포함된 UTF-8을 사용합니다.
+
+    Args:
+        path: CSV 파일 경로
+        mode: 파일 열기 모드 ("r", "w", "a")
+
+    Returns:
+        열린 텍스트 파일 객체
+
+    Raises:
+        OSError: 파일을 열 수 없는 경우
+    """
+    return open(path, mode, newline="", encoding="utf-8-sig")
+
+
+def append_rows(
+    path: Path, rows: Iterable[Sequence[str]], indexed_signature: tuple[int, int]
+) -> tuple[int, int]:
+    """CSV 행을 메모리 버퍼에 모아 파일 끝에 한 번에 쓰고, 인덱스에 기록할 서명을 반환합니다.
+
+    호출하는 쪽은 인덱스를 파일과 맞춘 뒤 같은 잠금 안에서 호출해야 합니다.
+    쓰기 후 파일 크기가 인덱스 시점 크기와 쓴 바이트 수의 합과 다르면 그 사이
+    다른 프로세스가 파일을 바꾼 것이므로, 다음 조회에서 인덱스를 다시 만들도록
+    (-1, -1)을 반환합니다.
+
+    Args:
+        path: CSV 파일 경로
+        rows: 추가할 행 목록 (컬럼 순서대로 정렬된 값)
+        indexed_signature: 쓰기 전 인덱스에 반영된 파일 서명
+
+    Returns:
+        인덱스에 기록할 (수정 시각(ns), 파일 크기) 튜플
+
+    Raises:
+        OSError: 파일 쓰기 또는 정보 조회에 실패한 경우
+    """
+    buffer = io.StringIO(newline="")
+    csv.writer(buffer).writerows(rows)
+    data = buffer.getvalue()
+    with open_csv(path, "a") as f:
+        f.write(data)
+
+    signature = file_signature(path)
+    if signature[1] != indexed_signature[1] + len(data.encode("utf-8")):
+        return -1, -1
+    return signature
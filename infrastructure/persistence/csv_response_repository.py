@@ -1,17 +1,32 @@
 import csv
+import threading
+from collections import defaultdict
+from operator import itemgetter
 from pathlib import Path
+from typing import ClassVar
 from domain.entities.response import Response
 from domain.repositories.response_repository import ResponseRepository
+from infrastructure.persistence.csv_file import append_rows, open_csv
+from infrastructure.persistence.file_signature import file_signature
 
 
 class CsvResponseRepository(ResponseRepository):
     """CSV 파일 기반 응답 저장소 구현입니다.
 
+    CSV 파일을 한 번 읽어 설문 ID별 메모리 인덱스를 만들고,
+    파일의 수정 시각이나 크기가 바뀌면 다시 읽습니다.
+
     Attributes:
         data_dir: CSV 파일이 저장될 디렉토리 경로
         responses_file: responses.csv 파일 경로
+        RESPONSE_FIELDS: responses.csv 컬럼 순서
     """
 
+    RESPONSE_FIELDS: ClassVar[tuple[str, ...]] = (
+        "id", "survey_id", "question_id", "answer", "respondent_id", "created_at"
+    )
+    _response_values: ClassVar[itemgetter] = itemgetter(*RESPONSE_FIELDS)
+
     def __init__(self, data_dir: Path):
         """CSV 저장소를 초기화합니다.
 
@@ -20,6 +35,9 @@ class CsvResponseRepository(ResponseRepository):
         """
         self.data_dir = data_dir
         self.responses_file = data_dir / "responses.csv"
+        self._lock = threading.Lock()
+        self._signature: tuple[int, int] = (-1, -1)
+        self._responses_by_survey: defaultdict[str, list[Response]] = defaultdict(list)
         self._ensure_file_exists()
 
     def _ensure_file_exists(self) -> None:
@@ -27,11 +45,32 @@ class CsvResponseRepository(ResponseRepository):
         self.data_dir.mkdir(parents=True, exist_ok=True)
 
         if not self.responses_file.exists():
-            with open(self.responses_file, "w", newline="", encoding="utf-8-sig") as f:
-                writer = csv.DictWriter(
-                    f, fieldnames=["id", "survey_id", "question_id", "answer", "respondent_id", "created_at"]
-                )
-                writer.writeheader()
+            with open_csv(self.responses_file, "w") as f:
+                csv.writer(f).writerow(self.RESPONSE_FIELDS)
+
+    def _refresh_index(self) -> None:
+        """파일이 바뀌었으면 메모리 인덱스를 다시 만듭니다.
+
+        호출하는 쪽에서 self._lock을 잡고 있어야 합니다.
+        """
+        signature = file_signature(self.responses_file)
+        if signature == self._signature:
+            return
+
+        self._responses_by_survey.clear()
+        with open_csv(self.responses_file, "r") as f:
+            reader = csv.DictReader(f)
+            self._add_to_index([Response.from_dict(row) for row in reader])
+        self._signature = signature
+
+    def _add_to_index(self, responses: list[Response]) -> None:
+        """응답을 메모리 인덱스에 추가합니다.
+
+        Args:
+            responses: 추가할 응답 엔티티 목록
+        """
+        for response in responses:
+            self._responses_by_survey[response.survey_id].append(response)
 
     def save(self, response: Response) -> None:
         """응답을 CSV에 저장합니다.
@@ -39,42 +78,41 @@ class CsvResponseRepository(ResponseRepository):
         Args:
             response: 저장할 응답 엔티티
         """
-        with open(self.responses_file, "a", newline="", encoding="utf-8-sig") as f:
-            writer = csv.DictWriter(
-                f, fieldnames=["id", "survey_id", "question_id", "answer", "respondent_id", "created_at"]
-            )
-            writer.writerow(response.to_dict())
+        self.save_many([response])
+
+    def save_many(self, responses: list[Response]) -> None:
+        """여러 응답을 파일을 한 번만 열어 CSV에 저장합니다.
+
+        Args:
+            responses: 저장할 응답 엔티티 목록
+        """
+        rows = [self._response_values(response.to_dict()) for response in responses]
+        with self._lock:
+            self._refresh_index()
+            self._signature = append_rows(self.responses_file, rows, self._signature)
+            self._add_to_index(responses)
 
-    def find_by_survey_id(self, survey_id: str) -> list[Response]:
-        """설문 ID로 응답 목록을 조회합니다.
+    def find_answers_by_survey_id(self, survey_id: str) -> dict[str, list[str]]:
+        """설문 ID로 답변을 질문 ID별로 묶어 조회합니다.
 
         Args:
             survey_id: 설문 식별자
 
         Returns:
-            응답 엔티티 목록
+            질문 ID별 답변 목록 (저장 순서 유지)
         """
-        responses = []
-        with open(self.responses_file, "r", encoding="utf-8-sig") as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                if row["survey_id"] == survey_id:
-                    responses.append(Response.from_dict(row))
-        return responses
-
-    def find_by_question_id(self, question_id: str) -> list[Response]:
-        """질문 ID로 응답 목록을 조회합니다.
+        answers_by_question: defaultdict[str, list[str]] = defaultdict(list)
+        with self._lock:
+            self._refresh_index()
+            for response in self._responses_by_survey.get(survey_id, []):
+                answers_by_question[response.question_id].append(response.answer)
+        return dict(answers_by_question)
 
-        Args:
-            question_id: 질문 식별자
+    def get_revision(self) -> str:
+        """응답 파일의 수정 시각과 크기로 변경 버전을 조회합니다.
 
         Returns:
-            응답 엔티티 목록
+            "수정시각(ns):크기" 형식의 버전 문자열
         """
-        responses = []
-        with open(self.responses_file, "r", encoding="utf-8-sig") as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                if row["question_id"] == question_id:
-                    responses.append(Response.from_dict(row))
-        return responses
+        mtime_ns, size = file_signature(self.responses_file)
+        return f"{mtime_ns}:{size}"
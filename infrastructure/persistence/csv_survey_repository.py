@@ -1,19 +1,38 @@
 import csv
+import threading
+from collections import defaultdict
+from dataclasses import replace
+from itertools import islice
+from operator import itemgetter
 from pathlib import Path
+from typing import ClassVar
 from domain.entities.survey import Survey
 from domain.entities.question import Question
 from domain.repositories.survey_repository import SurveyRepository
+from domain.value_objects.survey_page import SurveyPage
+from infrastructure.persistence.csv_file import append_rows, open_csv
+from infrastructure.persistence.file_signature import file_signature
 
 
 class CsvSurveyRepository(SurveyRepository):
     """CSV 파일 기반 설문 저장소 구현입니다.
 
+    두 CSV 파일을 한 번 읽어 질문 튜플이 포함된 설문 엔티티를 설문 ID별로
+    인덱싱하고, 어느 파일이든 수정 시각이나 크기가 바뀌면 다시 읽습니다.
+
     Attributes:
         data_dir: CSV 파일이 저장될 디렉토리 경로
         surveys_file: surveys.csv 파일 경로
         questions_file: questions.csv 파일 경로
+        SURVEY_FIELDS: surveys.csv 컬럼 순서
+        QUESTION_FIELDS: questions.csv 컬럼 순서
     """
 
+    SURVEY_FIELDS: ClassVar[tuple[str, ...]] = ("id", "title", "description", "created_at")
+    QUESTION_FIELDS: ClassVar[tuple[str, ...]] = ("id", "survey_id", "text", "question_type", "options")
+    _survey_values: ClassVar[itemgetter] = itemgetter(*SURVEY_FIELDS)
+    _question_values: ClassVar[itemgetter] = itemgetter(*QUESTION_FIELDS)
+
     def __init__(self, data_dir: Path):
         """CSV 저장소를 초기화합니다.
 
@@ -23,6 +42,10 @@ class CsvSurveyRepository(SurveyRepository):
         self.data_dir = data_dir
         self.surveys_file = data_dir / "surveys.csv"
         self.questions_file = data_dir / "questions.csv"
+        self._lock = threading.Lock()
+        self._signatures: tuple[tuple[int, int], tuple[int, int]] = ((-1, -1), (-1, -1))
+        self._surveys: dict[str, Survey] = {}
+        self._questions_by_survey: dict[str, tuple[Question, ...]] = {}
         self._ensure_files_exist()
 
     def _ensure_files_exist(self) -> None:
@@ -30,14 +53,47 @@ class CsvSurveyRepository(SurveyRepository):
         self.data_dir.mkdir(parents=True, exist_ok=True)
 
         if not self.surveys_file.exists():
-            with open(self.surveys_file, "w", newline="", encoding="utf-8-sig") as f:
-                writer = csv.DictWriter(f, fieldnames=["id", "title", "description", "created_at"])
-                writer.writeheader()
+            with open_csv(self.surveys_file, "w") as f:
+                csv.writer(f).writerow(self.SURVEY_FIELDS)
 
         if not self.questions_file.exists():
-            with open(self.questions_file, "w", newline="", encoding="utf-8-sig") as f:
-                writer = csv.DictWriter(f, fieldnames=["id", "survey_id", "text", "question_type", "options"])
-                writer.writeheader()
+            with open_csv(self.questions_file, "w") as f:
+                csv.writer(f).writerow(self.QUESTION_FIELDS)
+
+    def _current_signatures(self) -> tuple[tuple[int, int], tuple[int, int]]:
+        """두 CSV 파일의 현재 서명을 조회합니다.
+
+        Returns:
+            (설문 파일 서명, 질문 파일 서명) 튜플
+        """
+        return file_signature(self.surveys_file), file_signature(self.questions_file)
+
+    def _refresh_index(self) -> None:
+        """파일이 바뀌었으면 메모리 인덱스를 다시 만듭니다.
+
+        호출하는 쪽에서 self._lock을 잡고 있어야 합니다.
+        """
+        signatures = self._current_signatures()
+        if signatures == self._signatures:
+            return
+
+        questions_by_survey: defaultdict[str, list[Question]] = defaultdict(list)
+        with open_csv(self.questions_file, "r") as f:
+            reader = csv.DictReader(f)
+            for row in reader:
+                questions_by_survey[row["survey_id"]].append(Question.from_dict(row))
+        self._questions_by_survey = {
+            survey_id: tuple(questions) for survey_id, questions in questions_by_survey.items()
+        }
+
+        with open_csv(self.surveys_file, "r") as f:
+            reader = csv.DictReader(f)
+            self._surveys = {
+                row["id"]: Survey.from_dict(row, self._questions_by_survey.get(row["id"], ()))
+                for row in reader
+            }
+
+        self._signatures = signatures
 
     def save_survey(self, survey: Survey) -> None:
         """설문을 CSV에 저장합니다.
@@ -45,9 +101,21 @@ class CsvSurveyRepository(SurveyRepository):
         Args:
             survey: 저장할 설문 엔티티
         """
-        with open(self.surveys_file, "a", newline="", encoding="utf-8-sig") as f:
-            writer = csv.DictWriter(f, fieldnames=["id", "title", "description", "created_at"])
-            writer.writerow(survey.to_dict())
+        self.save_surveys([survey])
+
+    def save_surveys(self, surveys: list[Survey]) -> None:
+        """여러 설문을 파일을 한 번만 열어 CSV에 저장합니다.
+
+        Args:
+            surveys: 저장할 설문 엔티티 목록
+        """
+        rows = [self._survey_values(survey.to_dict()) for survey in surveys]
+        with self._lock:
+            self._refresh_index()
+            surveys_signature, questions_signature = self._signatures
+            self._signatures = (append_rows(self.surveys_file, rows, surveys_signature), questions_signature)
+            for survey in surveys:
+                self._surveys[survey.id] = replace(survey, questions=self._questions_by_survey.get(survey.id, ()))
 
     def save_question(self, question: Question) -> None:
         """질문을 CSV에 저장합니다.
@@ -55,9 +123,27 @@ class CsvSurveyRepository(SurveyRepository):
         Args:
             question: 저장할 질문 엔티티
         """
-        with open(self.questions_file, "a", newline="", encoding="utf-8-sig") as f:
-            writer = csv.DictWriter(f, fieldnames=["id", "survey_id", "text", "question_type", "options"])
-            writer.writerow(question.to_dict())
+        self.save_questions([question])
+
+    def save_questions(self, questions: list[Question]) -> None:
+        """여러 질문을 파일을 한 번만 열어 CSV에 저장합니다.
+
+        Args:
+            questions: 저장할 질문 엔티티 목록
+        """
+        rows = [self._question_values(question.to_dict()) for question in questions]
+        with self._lock:
+            self._refresh_index()
+            surveys_signature, questions_signature = self._signatures
+            self._signatures = (surveys_signature, append_rows(self.questions_file, rows, questions_signature))
+            added_by_survey: defaultdict[str, list[Question]] = defaultdict(list)
+            for question in questions:
+                added_by_survey[question.survey_id].append(question)
+            for survey_id, added in added_by_survey.items():
+                survey_questions = self._questions_by_survey.get(survey_id, ()) + tuple(added)
+                self._questions_by_survey[survey_id] = survey_questions
+                if survey_id in self._surveys:
+                    self._surveys[survey_id] = replace(self._surveys[survey_id], questions=survey_questions)
 
     def find_survey_by_id(self, survey_id: str) -> Survey | None:
         """ID로 설문을 조회합니다.
@@ -68,13 +154,22 @@ class CsvSurveyRepository(SurveyRepository):
         Returns:
             설문 엔티티 또는 None
         """
-        with open(self.surveys_file, "r", encoding="utf-8-sig") as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                if row["id"] == survey_id:
-                    questions = self.find_questions_by_survey_id(survey_id)
-                    return Survey.from_dict(row, tuple(questions))
-        return None
+        with self._lock:
+            self._refresh_index()
+            return self._surveys.get(survey_id)
+
+    def exists_survey(self, survey_id: str) -> bool:
+        """ID에 해당하는 설문이 있는지 확인합니다.
+
+        Args:
+            survey_id: 설문 식별자
+
+        Returns:
+            설문이 있으면 True, 없으면 False
+        """
+        with self._lock:
+            self._refresh_index()
+            return survey_id in self._surveys
 
     def find_all_surveys(self) -> list[Survey]:
         """모든 설문을 조회합니다.
@@ -82,13 +177,26 @@ class CsvSurveyRepository(SurveyRepository):
         Returns:
             설문 엔티티 목록
         """
-        surveys = []
-        with open(self.surveys_file, "r", encoding="utf-8-sig") as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                questions = self.find_questions_by_survey_id(row["id"])
-                surveys.append(Survey.from_dict(row, tuple(questions)))
-        return surveys
+        with self._lock:
+            self._refresh_index()
+            return list(self._surveys.values())
+
+    def find_surveys(self, offset: int, limit: int) -> SurveyPage:
+        """저장 순서 기준으로 설문 일부와 전체 설문 수를 한 번의 잠금 안에서 조회합니다.
+
+        Args:
+            offset: 건너뛸 설문 수 (0 이상)
+            limit: 조회할 최대 설문 수 (1 이상)
+
+        Returns:
+            같은 시점의 설문 페이지와 전체 설문 수
+        """
+        with self._lock:
+            self._refresh_index()
+            return SurveyPage(
+                surveys=tuple(islice(self._surveys.values(), offset, offset + limit)),
+                total=len(self._surveys),
+            )
 
     def find_questions_by_survey_id(self, survey_id: str) -> list[Question]:
         """설문 ID로 질문 목록을 조회합니다.
@@ -99,10 +207,6 @@ class CsvSurveyRepository(SurveyRepository):
         Returns:
             질문 엔티티 목록
         """
-        questions = []
-        with open(self.questions_file, "r", encoding="utf-8-sig") as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                if row["survey_id"] == survey_id:
-                    questions.append(Question.from_dict(row))
-        return questions
+        with self._lock:
+            self._refresh_index()
+            return list(self._questions_by_survey.get(survey_id, ()))
@@ -0,0 +1,18 @@
+from pathlib import Path
+
+
+def file_signature(path: Path) -> tuple[int, int]:
+    """파일의 변경 여부를 판별하는 서명을 조회합니다.
+
+    Args:
+        path: 대상 파일 경로
+
+    Returns:
+        (수정 시각(ns), 파일 크기) 튜플
+
+    Raises:
+        OSError: 파일 정보를 읽을 수 없는 경우
+    """
+    stat = path.stat()
+    return stat.st_mtime_ns, stat.st_size
+
@@ -1,3 +1,4 @@
+from functools import lru_cache
 from pathlib import Path
 from application.survey_service import SurveyService
 from application.response_service import ResponseService
@@ -8,22 +9,47 @@ from infrastructure.persistence.csv_response_repository import CsvResponseReposi
 DATA_DIR = Path("data")
 
 
+@lru_cache(maxsize=1)
+def get_survey_repository() -> CsvSurveyRepository:
+    """요청 간에 공유하는 설문 저장소를 생성합니다.
+
+    저장소의 메모리 인덱스를 재사용하기 위해 프로세스당 한 번만 생성합니다.
+
+    Returns:
+        CsvSurveyRepository 인스턴스
+    """
+    return CsvSurveyRepository(DATA_DIR)
+
+
+@lru_cache(maxsize=1)
+def get_response_repository() -> CsvResponseRepository:
+    """요청 간에 공유하는 응답 저장소를 생성합니다.
+
+    저장소의 메모리 인덱스를 재사용하기 위해 프로세스당 한 번만 생성합니다.
+
+    Returns:
+        CsvResponseRepository 인스턴스
+    """
+    return CsvResponseRepository(DATA_DIR)
+
+
+@lru_cache(maxsize=1)
 def get_survey_service() -> SurveyService:
-    """SurveyService 인스턴스를 생성합니다.
+    """요청 간에 공유하는 SurveyService 인스턴스를 생성합니다.
 
     Returns:
         SurveyService 인스턴스
     """
-    survey_repo = CsvSurveyRepository(DATA_DIR)
-    return SurveyService(survey_repo)
+    return SurveyService(get_survey_repository())
 
 
+@lru_cache(maxsize=1)
 def get_response_service() -> ResponseService:
-    """ResponseService 인스턴스를 생성합니다.
+    """요청 간에 공유하는 ResponseService 인스턴스를 생성합니다.
+
+    결과 캐시를 요청 간에 재사용하기 위해 프로세스당 한 번만 생성합니다.
 
     Returns:
         ResponseService 인스턴스
     """
-    survey_repo = CsvSurveyRepository(DATA_DIR)
-    response_repo = CsvResponseRepository(DATA_DIR)
-    return ResponseService(response_repo, survey_repo)
+    return ResponseService(get_response_repository(), get_survey_repository())
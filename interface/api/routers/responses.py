@@ -1,3 +1,4 @@
+from typing import Any
 from fastapi import APIRouter, Depends, HTTPException, status
 from application.response_service import ResponseService
 from interface.api.dependencies import get_response_service
@@ -5,7 +6,6 @@ from interface.api.schemas.response import (
     SubmitResponseRequest,
     SubmitResponseResponse,
     SurveyResultsResponse,
-    QuestionResultResponse,
 )
 
 
@@ -145,7 +145,7 @@ def submit_response(
 def get_survey_results(
     survey_id: str,
     service: ResponseService = Depends(get_response_service)
-) -> SurveyResultsResponse:
+) -> dict[str, Any]:
     """설문 결과를 조회합니다.
 
     Args:
@@ -153,24 +153,14 @@ def get_survey_results(
         service: 응답 서비스
 
     Returns:
-        설문 결과 응답
+        SurveyResultsResponse 형식의 딕셔너리
 
     Raises:
         HTTPException: 설문을 찾을 수 없거나 결과 조회 실패 시
     """
     try:
         results = service.get_survey_results(survey_id)
-        formatted_results = {}
-        for question_id, result in results.items():
-            formatted_results[question_id] = QuestionResultResponse(
-                question=result["question"],
-                type=result["type"],
-                count=result["count"],
-                average=result.get("average"),
-                distribution=result.get("distribution"),
-                answers=result.get("answers")
-            )
-        return SurveyResultsResponse(survey_id=survey_id, results=formatted_results)
+        return {"survey_id": survey_id, "results": results}
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
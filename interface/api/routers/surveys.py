@@ -1,5 +1,6 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from application.survey_service import SurveyService
+from typing import Any
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from application.survey_service import SurveyService, SurveyPageConfig
 from domain.value_objects.types import QuestionType
 from interface.api.dependencies import get_survey_service
 from interface.api.schemas.survey import (
@@ -9,8 +10,6 @@ from interface.api.schemas.survey import (
     AddQuestionResponse,
     SurveyResponse,
     SurveyListResponse,
-    SurveyListItem,
-    QuestionResponse,
 )
 
 
@@ -75,7 +74,13 @@ def create_survey(
     response_model=SurveyListResponse,
     summary="설문 목록 조회",
     description="""
-    시스템에 등록된 모든 설문 목록을 조회합니다.
+    시스템에 등록된 설문 목록을 페이지 단위로 조회합니다.
+
+    **쿼리 파라미터:**
+    - `skip`: 건너뛸 설문 수 (기본값 0)
+    - `limit`: 조회할 최대 설문 수 (기본값 50, 최대 50으로 제한)
+
+    `total`은 페이지와 관계없이 전체 설문 수입니다.
 
     **응답 예시:**
     ```json
@@ -96,31 +101,35 @@ def create_survey(
     """
 )
 def list_surveys(
+    skip: int = Query(0, ge=0, description="건너뛸 설문 수"),
+    limit: int = Query(SurveyPageConfig.MAX_LIMIT, ge=1, description="조회할 최대 설문 수"),
     service: SurveyService = Depends(get_survey_service)
-) -> SurveyListResponse:
+) -> dict[str, Any]:
     """설문 목록을 조회합니다.
 
     Args:
+        skip: 건너뛸 설문 수
+        limit: 조회할 최대 설문 수
         service: 설문 서비스
 
     Returns:
-        설문 목록 응답
+        SurveyListResponse 형식의 딕셔너리
 
     Raises:
         HTTPException: 목록 조회 실패 시
     """
     try:
-        surveys = service.get_all_surveys()
+        page = service.get_surveys(skip, limit)
         survey_items = [
-            SurveyListItem(
-                id=s.id,
-                title=s.title,
-                description=s.description,
-                question_count=str(len(s.questions))
-            )
-            for s in surveys
+            {
+                "id": s.id,
+                "title": s.title,
+                "description": s.description,
+                "question_count": str(len(s.questions)),
+            }
+            for s in page.surveys
         ]
-        return SurveyListResponse(surveys=survey_items, total=len(survey_items))
+        return {"surveys": survey_items, "total": page.total}
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -169,7 +178,7 @@ def list_surveys(
 def get_survey(
     survey_id: str,
     service: SurveyService = Depends(get_survey_service)
-) -> SurveyResponse:
+) -> dict[str, Any]:
     """설문 상세 정보를 조회합니다.
 
     Args:
@@ -177,7 +186,7 @@ def get_survey(
         service: 설문 서비스
 
     Returns:
-        설문 상세 응답
+        SurveyResponse 형식의 딕셔너리
 
     Raises:
         HTTPException: 설문을 찾을 수 없거나 조회 실패 시
@@ -185,21 +194,21 @@ def get_survey(
     try:
         survey = service.get_survey(survey_id)
         questions = [
-            QuestionResponse(
-                id=q.id,
-                text=q.text,
-                type=q.question_type.value,
-                options=list(q.options) if q.options else []
-            )
+            {
+                "id": q.id,
+                "text": q.text,
+                "type": q.question_type.value,
+                "options": list(q.options) if q.options else [],
+            }
             for q in survey.questions
         ]
-        return SurveyResponse(
-            id=survey.id,
-            title=survey.title,
-            description=survey.description,
-            created_at=survey.created_at.isoformat(),
-            questions=questions
-        )
+        return {
+            "id": survey.id,
+            "title": survey.title,
+            "description": survey.description,
+            "created_at": survey.created_at.isoformat(),
+            "questions": questions,
+        }
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -274,7 +283,7 @@ def add_question(
         HTTPException: 설문을 찾을 수 없거나 질문 추가 실패 시
     """
     try:
-        question_type = QuestionType(request.question_type)
+        question_type = QuestionType.from_value(request.question_type)
         question_id = service.add_question(
             survey_id,
             request.text,
@@ -1,6 +1,9 @@
 import logging
 from pathlib import Path
 from domain.value_objects.types import QuestionType
+from application.dto.question_spec import QuestionSpec
+from application.dto.response_submission import ResponseSubmission
+from application.dto.survey_spec import SurveySpec
 from application.survey_service import SurveyService
 from application.response_service import ResponseService
 from infrastructure.persistence.csv_survey_repository import CsvSurveyRepository
@@ -50,6 +53,26 @@ class SurveyCommands:
             logger.exception("설문 생성 중 오류가 발생했습니다")
             raise
 
+    def create_surveys(self, specs: list[SurveySpec]) -> list[str]:
+        """여러 설문을 한 번에 생성합니다.
+
+        Args:
+            specs: 생성할 설문 입력값 목록
+
+        Returns:
+            생성된 설문 ID 목록 (입력 순서 유지)
+
+        Raises:
+            Exception: 설문 생성 실패 시
+        """
+        try:
+            survey_ids = self.survey_service.create_surveys(specs)
+            logger.info(f"설문 {len(survey_ids)}개가 생성되었습니다")
+            return survey_ids
+        except Exception:
+            logger.exception("설문 생성 중 오류가 발생했습니다")
+            raise
+
     def add_question(
         self, survey_id: str, text: str, question_type: str, options: list[str] | None = None
     ) -> str:
@@ -68,7 +91,7 @@ class SurveyCommands:
             Exception: 질문 추가 실패 시
         """
         try:
-            q_type = QuestionType(question_type)
+            q_type = QuestionType.from_value(question_type)
             question_id = self.survey_service.add_question(survey_id, text, q_type, options)
             logger.info(f"질문이 추가되었습니다", extra={"question_id": question_id})
             return question_id
@@ -76,6 +99,27 @@ class SurveyCommands:
             logger.exception("질문 추가 중 오류가 발생했습니다")
             raise
 
+    def add_questions(self, survey_id: str, specs: list[QuestionSpec]) -> list[str]:
+        """여러 질문을 한 번에 추가합니다.
+
+        Args:
+            survey_id: 설문 ID
+            specs: 추가할 질문 입력값 목록
+
+        Returns:
+            생성된 질문 ID 목록 (입력 순서 유지)
+
+        Raises:
+            Exception: 질문 추가 실패 시
+        """
+        try:
+            question_ids = self.survey_service.add_questions(survey_id, specs)
+            logger.info(f"질문 {len(question_ids)}개가 추가되었습니다", extra={"survey_id": survey_id})
+            return question_ids
+        except Exception:
+            logger.exception("질문 추가 중 오류가 발생했습니다")
+            raise
+
     def get_survey(self, survey_id: str) -> dict[str, str | list[dict[str, str]]]:
         """설문을 조회합니다.
 
@@ -104,6 +148,7 @@ class SurveyCommands:
                 "title": survey.title,
                 "description": survey.description,
                 "created_at": survey.created_at.isoformat(),
+                "question_count": str(len(survey.questions)),
                 "questions": questions,
             }
         except Exception:
@@ -152,6 +197,23 @@ class SurveyCommands:
             logger.exception("응답 제출 중 오류가 발생했습니다")
             raise
 
+    def submit_responses(self, survey_id: str, submissions: list[ResponseSubmission]) -> None:
+        """여러 응답자의 응답을 한 번에 제출합니다.
+
+        Args:
+            survey_id: 설문 ID
+            submissions: 응답자별 응답 입력값 목록
+
+        Raises:
+            Exception: 응답 제출 실패 시
+        """
+        try:
+            self.response_service.submit_responses(survey_id, submissions)
+            logger.info(f"응답 {len(submissions)}건이 제출되었습니다", extra={"survey_id": survey_id})
+        except Exception:
+            logger.exception("응답 제출 중 오류가 발생했습니다")
+            raise
+
     def get_results(self, survey_id: str) -> dict[str, dict[str, int | float | list[str]]]:
         """설문 결과를 조회합니다.
 
@@ -1,5 +1,7 @@
 import logging
+from collections.abc import Callable, Mapping
 from pathlib import Path
+from types import MappingProxyType
 from interface.cli.commands import SurveyCommands
 from interface.cli.ui_helper import (
     MenuOption,
@@ -17,12 +19,19 @@ from interface.cli.ui_helper import (
 
 logger = logging.getLogger(__name__)
 
+QUESTION_TYPE_CHOICES: Mapping[str, str] = MappingProxyType({
+    "1": "text",
+    "2": "rating",
+    "3": "choice",
+})
+
 
 class InteractiveCLI:
     """인터랙티브 CLI 애플리케이션 클래스입니다.
 
     Attributes:
         commands: 설문 명령어 핸들러
+        menu_handlers: 메뉴 선택 번호별 플로우 메서드
     """
 
     def __init__(self, data_dir: Path):
@@ -32,6 +41,14 @@ class InteractiveCLI:
             data_dir: 데이터 디렉토리 경로
         """
         self.commands = SurveyCommands(data_dir)
+        self.menu_handlers: dict[str, Callable[[], None]] = {
+            MenuOption.CREATE_SURVEY: self._create_survey_flow,
+            MenuOption.ADD_QUESTION: self._add_question_flow,
+            MenuOption.VIEW_SURVEY: self._view_survey_flow,
+            MenuOption.LIST_SURVEYS: self._list_surveys_flow,
+            MenuOption.SUBMIT_RESPONSE: self._submit_response_flow,
+            MenuOption.VIEW_RESULTS: self._view_results_flow,
+        }
 
     def run(self) -> None:
         """CLI 애플리케이션을 실행합니다."""
@@ -42,7 +59,7 @@ class InteractiveCLI:
                 print_menu()
                 choice = get_input("선택")
 
-                if choice == MenuOption.EXIT.value:
+                if choice == MenuOption.EXIT:
                     print_info("프로그램을 종료합니다")
                     break
 
@@ -62,21 +79,23 @@ class InteractiveCLI:
         Args:
             choice: 메뉴 선택 번호
         """
-        if choice == MenuOption.CREATE_SURVEY.value:
-            self._create_survey_flow()
-        elif choice == MenuOption.ADD_QUESTION.value:
-            self._add_question_flow()
-        elif choice == MenuOption.VIEW_SURVEY.value:
-            self._view_survey_flow()
-        elif choice == MenuOption.LIST_SURVEYS.value:
-            self._list_surveys_flow()
-        elif choice == MenuOption.SUBMIT_RESPONSE.value:
-            self._submit_response_flow()
-        elif choice == MenuOption.VIEW_RESULTS.value:
-            self._view_results_flow()
-        else:
+        handler = self.menu_handlers.get(choice)
+        if handler is None:
             print_error("잘못된 선택입니다")
             pause()
+            return
+
+        handler()
+
+    def _print_survey_choices(self, surveys: list[dict[str, str]]) -> None:
+        """선택 가능한 설문 목록을 한 번에 출력합니다.
+
+        Args:
+            surveys: 설문 목록
+        """
+        lines = ["\n사용 가능한 설문:"]
+        lines.extend(f"{idx}. [{survey['id']}] {survey['title']}" for idx, survey in enumerate(surveys, 1))
+        print("\n".join(lines))
 
     def _create_survey_flow(self) -> None:
         """설문 생성 플로우를 실행합니다."""
@@ -115,9 +134,7 @@ class InteractiveCLI:
                 pause()
                 return
 
-            print("\n사용 가능한 설문:")
-            for idx, survey in enumerate(surveys, 1):
-                print(f"{idx}. [{survey['id']}] {survey['title']}")
+            self._print_survey_choices(surveys)
 
             survey_id = get_input("\n설문 ID")
             if not survey_id:
@@ -137,13 +154,7 @@ class InteractiveCLI:
             print("3. 객관식 (choice)")
 
             q_type_choice = get_input("유형 선택")
-            question_type_map = {
-                "1": "text",
-                "2": "rating",
-                "3": "choice",
-            }
-
-            question_type = question_type_map.get(q_type_choice)
+            question_type = QUESTION_TYPE_CHOICES.get(q_type_choice)
             if not question_type:
                 print_error("잘못된 유형입니다. 1, 2, 3 중 하나를 선택해주세요")
                 pause()
@@ -156,7 +167,7 @@ class InteractiveCLI:
                     print_error("선택지를 입력해주세요")
                     pause()
                     return
-                options = [opt.strip() for opt in options_input.split("|") if opt.strip()]
+                options = [option for opt in options_input.split("|") if (option := opt.strip())]
                 if len(options) < 2:
                     print_error("선택지는 최소 2개 이상이어야 합니다")
                     pause()
@@ -186,9 +197,7 @@ class InteractiveCLI:
                 pause()
                 return
 
-            print("\n사용 가능한 설문:")
-            for idx, survey in enumerate(surveys, 1):
-                print(f"{idx}. [{survey['id']}] {survey['title']}")
+            self._print_survey_choices(surveys)
 
             survey_id = get_input("\n설문 ID")
             if not survey_id:
@@ -197,18 +206,22 @@ class InteractiveCLI:
                 return
 
             survey_data = self.commands.get_survey(survey_id)
-
-            print(f"\n제목: {survey_data['title']}")
-            print(f"설명: {survey_data['description']}")
-            print(f"생성일: {survey_data['created_at']}")
-            print(f"\n질문 목록 (총 {len(survey_data['questions'])}개):")
-
-            for idx, question in enumerate(survey_data['questions'], 1):
-                print(f"\n[{idx}] {question['text']}")
-                print(f"    ID: {question['id']}")
-                print(f"    유형: {question['type']}")
-                if question['options']:
-                    print(f"    선택지: {', '.join(question['options'])}")
+            questions = survey_data['questions']
+
+            lines = [
+                f"\n제목: {survey_data['title']}",
+                f"설명: {survey_data['description']}",
+                f"생성일: {survey_data['created_at']}",
+                f"\n질문 목록 (총 {survey_data['question_count']}개):",
+            ]
+            for idx, question in enumerate(questions, 1):
+                options = question['options']
+                lines.append(f"\n[{idx}] {question['text']}")
+                lines.append(f"    ID: {question['id']}")
+                lines.append(f"    유형: {question['type']}")
+                if options:
+                    lines.append(f"    선택지: {', '.join(options)}")
+            print("\n".join(lines))
 
             pause()
 
@@ -231,12 +244,13 @@ class InteractiveCLI:
             if not surveys:
                 print_info("등록된 설문이 없습니다")
             else:
-                print(f"\n총 {len(surveys)}개의 설문:")
+                lines = [f"\n총 {len(surveys)}개의 설문:"]
                 for idx, survey in enumerate(surveys, 1):
-                    print(f"\n[{idx}] {survey['title']}")
-                    print(f"    ID: {survey['id']}")
-                    print(f"    설명: {survey['description']}")
-                    print(f"    질문 수: {survey['question_count']}개")
+                    lines.append(f"\n[{idx}] {survey['title']}")
+                    lines.append(f"    ID: {survey['id']}")
+                    lines.append(f"    설명: {survey['description']}")
+                    lines.append(f"    질문 수: {survey['question_count']}개")
+                print("\n".join(lines))
 
             pause()
 
@@ -256,9 +270,7 @@ class InteractiveCLI:
                 pause()
                 return
 
-            print("\n사용 가능한 설문:")
-            for idx, survey in enumerate(surveys, 1):
-                print(f"{idx}. [{survey['id']}] {survey['title']}")
+            self._print_survey_choices(surveys)
 
             survey_id = get_input("\n설문 ID")
             if not survey_id:
@@ -267,9 +279,10 @@ class InteractiveCLI:
                 return
 
             survey_data = self.commands.get_survey(survey_id)
+            questions = survey_data['questions']
             print(f"\n설문: {survey_data['title']}")
 
-            if not survey_data['questions']:
+            if not questions:
                 print_error("이 설문에는 질문이 없습니다. 먼저 질문을 추가해주세요")
                 pause()
                 return
@@ -283,13 +296,14 @@ class InteractiveCLI:
             answers = {}
             print("\n각 질문에 답변해주세요:")
 
-            for idx, question in enumerate(survey_data['questions'], 1):
+            for idx, question in enumerate(questions, 1):
+                question_type = question['type']
                 print(f"\n[{idx}] {question['text']}")
-                print(f"    유형: {question['type']}")
+                print(f"    유형: {question_type}")
 
-                if question['type'] == 'choice':
+                if question_type == 'choice':
                     print(f"    선택지: {', '.join(question['options'])}")
-                elif question['type'] == 'rating':
+                elif question_type == 'rating':
                     print("    1-5 사이의 숫자를 입력하세요")
 
                 answer = get_input("답변")
@@ -328,9 +342,7 @@ class InteractiveCLI:
                 pause()
                 return
 
-            print("\n사용 가능한 설문:")
-            for idx, survey in enumerate(surveys, 1):
-                print(f"{idx}. [{survey['id']}] {survey['title']}")
+            self._print_survey_choices(surveys)
 
             survey_id = get_input("\n설문 ID")
             if not survey_id:
@@ -345,23 +357,24 @@ class InteractiveCLI:
                 pause()
                 return
 
-            print("\n설문 결과:")
+            lines = ["\n설문 결과:"]
             for question_id, stats in results.items():
-                print(f"\n질문 ID: {question_id}")
-                print(f"총 응답 수: {stats['total_responses']}개")
-
-                if 'average_rating' in stats:
-                    print(f"평균 평점: {stats['average_rating']:.2f}")
-
-                if 'distribution' in stats:
-                    print("응답 분포:")
-                    for answer, count in stats['distribution'].items():
-                        print(f"  {answer}: {count}개")
-
-                if 'text_responses' in stats:
-                    print("텍스트 응답:")
-                    for text in stats['text_responses']:
-                        print(f"  - {text}")
+                lines.append(f"\n질문 ID: {question_id}")
+                lines.append(f"총 응답 수: {stats['count']}개")
+
+                if 'average' in stats:
+                    lines.append(f"평균 평점: {stats['average']:.2f}")
+
+                distribution = stats.get('distribution')
+                if distribution is not None:
+                    lines.append("응답 분포:")
+                    lines.extend(f"  {answer}: {count}개" for answer, count in distribution.items())
+
+                text_answers = stats.get('answers')
+                if text_answers is not None:
+                    lines.append("텍스트 응답:")
+                    lines.extend(f"  - {text}" for text in text_answers)
+            print("\n".join(lines))
 
             pause()
 
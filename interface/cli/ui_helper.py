@@ -1,9 +1,9 @@
 from dataclasses import dataclass
 from typing import ClassVar
-from enum import Enum
+from enum import StrEnum
 
 
-class MenuOption(Enum):
+class MenuOption(StrEnum):
     CREATE_SURVEY = "1"
     ADD_QUESTION = "2"
     VIEW_SURVEY = "3"
@@ -17,6 +17,7 @@ class MenuOption(Enum):
 class UIConfig:
     LINE_WIDTH: ClassVar[int] = 60
     SEPARATOR: ClassVar[str] = "="
+    HEADER_LINE: ClassVar[str] = SEPARATOR * LINE_WIDTH
 
 
 def print_header(title: str) -> None:
@@ -25,9 +26,7 @@ def print_header(title: str) -> None:
     Args:
         title: 헤더 제목
     """
-    print("\n" + UIConfig.SEPARATOR * UIConfig.LINE_WIDTH)
-    print(title.center(UIConfig.LINE_WIDTH))
-    print(UIConfig.SEPARATOR * UIConfig.LINE_WIDTH)
+    print(f"\n{UIConfig.HEADER_LINE}\n{title.center(UIConfig.LINE_WIDTH)}\n{UIConfig.HEADER_LINE}")
 
 
 def print_section(title: str) -> None:
@@ -36,21 +35,21 @@ def print_section(title: str) -> None:
     Args:
         title: 섹션 제목
     """
-    print(f"\n{title}")
-    print("-" * len(title))
+    print(f"\n{title}\n{'-' * len(title)}")
 
 
 def print_menu() -> None:
     """메인 메뉴를 출력합니다."""
     print_section("메뉴")
-    print("1. 설문 생성")
-    print("2. 질문 추가")
-    print("3. 설문 조회")
-    print("4. 설문 목록")
-    print("5. 응답 제출")
-    print("6. 결과 조회")
-    print("0. 종료")
-    print()
+    print(
+        "1. 설문 생성\n"
+        "2. 질문 추가\n"
+        "3. 설문 조회\n"
+        "4. 설문 목록\n"
+        "5. 응답 제출\n"
+        "6. 결과 조회\n"
+        "0. 종료\n"
+    )
 
 
 def get_input(prompt: str) -> str:
@@ -1,28 +1,45 @@
-import shutil
-import tempfile
-from pathlib import Path
+import csv
 import pytest
+from dataclasses import dataclass
+from pathlib import Path
+from infrastructure.persistence.csv_file import open_csv
+from infrastructure.persistence.csv_response_repository import CsvResponseRepository
+from infrastructure.persistence.csv_survey_repository import CsvSurveyRepository
 from interface.cli.commands import SurveyCommands
 
 
-@pytest.fixture
-def temp_data_dir():
-    """테스트용 임시 데이터 디렉토리를 생성합니다.
+@dataclass(frozen=True, slots=True)
+class CsvPaths:
+    """테스트 데이터 디렉토리와 CSV 파일 경로를 미리 계산해 둔 묶음입니다.
 
-    Yields:
-        임시 디렉토리 Path 객체
+    Attributes:
+        root: 데이터 디렉토리
+        surveys_csv: 설문 CSV 파일 경로
+        questions_csv: 질문 CSV 파일 경로
+        responses_csv: 응답 CSV 파일 경로
+    """
+    root: Path
+    surveys_csv: Path
+    questions_csv: Path
+    responses_csv: Path
 
-    Raises:
-        OSError: 디렉토리 생성/삭제 실패 시
+
+@pytest.fixture(scope="session")
+def temp_data_dir(tmp_path_factory):
+    """테스트 세션 전체가 공유하는 임시 데이터 디렉토리를 생성합니다.
+
+    Args:
+        tmp_path_factory: pytest 임시 경로 팩토리
+
+    Returns:
+        임시 디렉토리 Path 객체
     """
-    temp_dir = Path(tempfile.mkdtemp())
-    yield temp_dir
-    shutil.rmtree(temp_dir)
+    return tmp_path_factory.mktemp("data")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def survey_commands(temp_data_dir):
-    """테스트용 SurveyCommands 인스턴스를 생성합니다.
+    """테스트 세션 전체가 공유하는 SurveyCommands 인스턴스를 생성합니다.
 
     Args:
         temp_data_dir: 임시 데이터 디렉토리 픽스처
@@ -31,3 +48,49 @@ def survey_commands(temp_data_dir):
         SurveyCommands 인스턴스
     """
     return SurveyCommands(temp_data_dir)
+
+
+@pytest.fixture(scope="session")
+def csv_paths(temp_data_dir):
+    """테스트 세션 전체가 공유하는 CSV 파일 경로를 한 번 계산합니다.
+
+    Args:
+        temp_data_dir: 임시 데이터 디렉토리 픽스처
+
+    Returns:
+        CsvPaths 인스턴스
+    """
+    return CsvPaths(
+        root=temp_data_dir,
+        surveys_csv=temp_data_dir / "surveys.csv",
+        questions_csv=temp_data_dir / "questions.csv",
+        responses_csv=temp_data_dir / "responses.csv",
+    )
+
+
+@pytest.fixture(autouse=True)
+def reset_data_files(survey_commands, csv_paths):
+    """테스트가 끝날 때마다 CSV 파일을 헤더만 남기고 비웁니다.
+
+    파일 크기가 바뀌므로 공유 SurveyCommands의 메모리 인덱스는
+    다음 조회 시 빈 파일을 다시 읽습니다.
+
+    Args:
+        survey_commands: SurveyCommands 픽스처
+        csv_paths: CSV 파일 경로 픽스처
+
+    Yields:
+        None
+
+    Raises:
+        OSError: 파일 쓰기 실패 시
+    """
+    yield
+    csv_headers = (
+        (csv_paths.surveys_csv, CsvSurveyRepository.SURVEY_FIELDS),
+        (csv_paths.questions_csv, CsvSurveyRepository.QUESTION_FIELDS),
+        (csv_paths.responses_csv, CsvResponseRepository.RESPONSE_FIELDS),
+    )
+    for path, fields in csv_headers:
+        with open_csv(path, "w") as f:
+            csv.writer(f).writerow(fields)
@@ -1,6 +1,59 @@
-import pytest
+import codecs
 import csv
+import io
+import os
+import re
+import pytest
+from datetime import datetime
 from pathlib import Path
+from application.dto.question_spec import QuestionSpec
+from application.dto.response_submission import ResponseSubmission
+from application.dto.survey_spec import SurveySpec
+from application.survey_service import SurveyPageConfig
+from domain.entities.question import Question
+from domain.entities.restore import restore_entity
+from domain.entities.survey import Survey
+from domain.value_objects.types import QuestionType
+from infrastructure.persistence.csv_file import append_rows, open_csv
+from infrastructure.persistence.file_signature import file_signature
+from interface.api.routers.surveys import list_surveys
+from interface.api.schemas.survey import SurveyListResponse
+from interface.cli.commands import SurveyCommands
+
+
+_RATINGS = (5, 4, 5, 3, 4, 5, 4, 5, 3, 4)
+_RATING_AVG = sum(_RATINGS) / len(_RATINGS)
+_NOT_FOUND = re.compile("설문을 찾을 수 없습니다")
+_UNSUPPORTED_TYPE = re.compile("지원하지 않는 질문 유형입니다")
+
+
+def _count_csv_rows(path: Path) -> int:
+    """CSV 파일의 헤더를 제외한 행 수를 파싱 없이 셉니다.
+
+    필드에 줄바꿈이 없는 테스트 데이터에만 사용합니다.
+
+    Args:
+        path: CSV 파일 경로
+
+    Returns:
+        데이터 행 수
+    """
+    return path.read_bytes().count(b"\n") - 1
+
+
+def _read_csv(path: Path) -> list[dict[str, str]]:
+    """CSV 파일을 한 번에 읽어 행 목록으로 반환합니다.
+
+    utf-8-sig 디코더 대신 선행 BOM을 한 번만 제거한 뒤 디코딩합니다.
+
+    Args:
+        path: CSV 파일 경로
+
+    Returns:
+        헤더를 키로 하는 행 딕셔너리 목록
+    """
+    data = path.read_bytes().removeprefix(codecs.BOM_UTF8)
+    return list(csv.DictReader(io.StringIO(data.decode("utf-8"), newline="")))
 
 
 class TestScenario01:
@@ -15,7 +68,7 @@ class TestScenario01:
 
         시나리오:
             1. 병원 관리자가 만족도 설문 생성
-            2. 질문 3개 추가 (평점형, 객관식, 텍스트형)
+            2. 질문 3개를 한 번에 추가 (평점형, 객관식, 텍스트형)
             3. 환자 1명이 응답 제출
             4. 설문 조회 및 검증
             5. 결과 조회 및 검증
@@ -27,32 +80,24 @@ class TestScenario01:
         assert survey_id is not None
         assert len(survey_id) > 0
 
-        q1_id = survey_commands.add_question(
-            survey_id=survey_id,
-            text="전반적인 병원 서비스에 만족하십니까?",
-            question_type="rating"
-        )
-        assert q1_id is not None
-
-        q2_id = survey_commands.add_question(
-            survey_id=survey_id,
-            text="가장 만족스러웠던 부분은?",
-            question_type="choice",
-            options=["의료진", "시설", "대기시간", "진료"]
-        )
-        assert q2_id is not None
-
-        q3_id = survey_commands.add_question(
+        q1_id, q2_id, q3_id = survey_commands.add_questions(
             survey_id=survey_id,
-            text="개선 사항을 작성해주세요",
-            question_type="text"
+            specs=[
+                QuestionSpec(text="전반적인 병원 서비스에 만족하십니까?", question_type=QuestionType.RATING),
+                QuestionSpec(
+                    text="가장 만족스러웠던 부분은?",
+                    question_type=QuestionType.MULTIPLE_CHOICE,
+                    options=("의료진", "시설", "대기시간", "진료"),
+                ),
+                QuestionSpec(text="개선 사항을 작성해주세요", question_type=QuestionType.TEXT),
+            ]
         )
-        assert q3_id is not None
 
         survey_data = survey_commands.get_survey(survey_id)
         assert survey_data["id"] == survey_id
         assert survey_data["title"] == "2024년 병원 만족도 조사"
-        assert len(survey_data["questions"]) == 3
+        assert survey_data["question_count"] == "3"
+        assert [q["id"] for q in survey_data["questions"]] == [q1_id, q2_id, q3_id]
 
         survey_commands.submit_response(
             survey_id=survey_id,
@@ -75,62 +120,61 @@ class TestScenario01:
 class TestScenario02:
     """시나리오 2: 다양한 질문 유형 테스트"""
 
-    def test_all_question_types(self, survey_commands):
-        """모든 질문 유형이 올바르게 작동하는지 테스트합니다.
+    @pytest.mark.parametrize(
+        ("question_type", "options", "answer", "check"),
+        [
+            (
+                "text",
+                None,
+                "이것은 텍스트 응답입니다",
+                lambda result: result["answers"][0] == "이것은 텍스트 응답입니다",
+            ),
+            ("rating", None, "4", lambda result: result["average"] == 4.0),
+            (
+                "choice",
+                ["옵션1", "옵션2", "옵션3"],
+                "옵션2",
+                lambda result: result["distribution"]["옵션2"] == 1,
+            ),
+        ],
+        ids=["text", "rating", "choice"],
+    )
+    def test_all_question_types(self, survey_commands, question_type, options, answer, check):
+        """각 질문 유형이 올바르게 작동하는지 유형별로 독립 테스트합니다.
 
         Args:
             survey_commands: SurveyCommands 픽스처
+            question_type: 테스트할 질문 유형 (text/rating/choice)
+            options: 객관식 선택지
+            answer: 제출할 답변
+            check: 질문 결과를 검증하는 함수
 
         시나리오:
             1. 설문 생성
-            2. 각 질문 유형 추가 (TEXT, RATING, MULTIPLE_CHOICE)
-            3. 각 유형별로 응답 제출
-            4. 각 유형별 결과 검증
+            2. 해당 유형의 질문 추가
+            3. 응답 제출
+            4. 유형별 결과 검증
         """
         survey_id = survey_commands.create_survey(
             title="질문 유형 테스트",
-            description="모든 질문 유형을 테스트합니다"
-        )
-
-        text_q = survey_commands.add_question(
-            survey_id=survey_id,
-            text="자유 의견을 작성해주세요",
-            question_type="text"
-        )
-
-        rating_q = survey_commands.add_question(
-            survey_id=survey_id,
-            text="평점을 매겨주세요",
-            question_type="rating"
+            description=f"{question_type} 질문 유형을 테스트합니다"
         )
-
-        choice_q = survey_commands.add_question(
+        question_id = survey_commands.add_question(
             survey_id=survey_id,
-            text="선택해주세요",
-            question_type="choice",
-            options=["옵션1", "옵션2", "옵션3"]
+            text="질문 유형별 응답을 작성해주세요",
+            question_type=question_type,
+            options=options
         )
 
         survey_commands.submit_response(
             survey_id=survey_id,
             respondent_id="test_user",
-            answers={
-                text_q: "이것은 텍스트 응답입니다",
-                rating_q: "4",
-                choice_q: "옵션2"
-            }
+            answers={question_id: answer}
         )
 
-        results = survey_commands.get_results(survey_id)
-
-        assert results[text_q]["type"] == "text"
-        assert results[text_q]["answers"][0] == "이것은 텍스트 응답입니다"
-
-        assert results[rating_q]["type"] == "rating"
-        assert results[rating_q]["average"] == 4.0
-
-        assert results[choice_q]["type"] == "choice"
-        assert results[choice_q]["distribution"]["옵션2"] == 1
+        result = survey_commands.get_results(survey_id)[question_id]
+        assert result["type"] == question_type
+        assert check(result)
 
 
 class TestScenario03:
@@ -144,7 +188,7 @@ class TestScenario03:
 
         시나리오:
             1. 설문 생성 및 질문 추가
-            2. 10명의 응답자가 응답 제출
+            2. 10명의 응답자 응답을 한 번에 제출
             3. 통계 결과 검증 (평균, 분포 등)
         """
         survey_id = survey_commands.create_survey(
@@ -165,36 +209,26 @@ class TestScenario03:
             options=["오전", "오후", "저녁"]
         )
 
-        responses_data = [
-            ("patient_001", "5", "오전"),
-            ("patient_002", "4", "오전"),
-            ("patient_003", "5", "오후"),
-            ("patient_004", "3", "오전"),
-            ("patient_005", "4", "저녁"),
-            ("patient_006", "5", "오후"),
-            ("patient_007", "4", "오전"),
-            ("patient_008", "5", "저녁"),
-            ("patient_009", "3", "오후"),
-            ("patient_010", "4", "오전"),
-        ]
-
-        for respondent_id, rating, choice in responses_data:
-            survey_commands.submit_response(
-                survey_id=survey_id,
-                respondent_id=respondent_id,
-                answers={
-                    rating_q: rating,
-                    choice_q: choice
-                }
-            )
+        respondent_ids = tuple(f"patient_{i:03d}" for i in range(1, len(_RATINGS) + 1))
+        choices = ("오전", "오전", "오후", "오전", "저녁", "오후", "오전", "저녁", "오후", "오전")
+
+        survey_commands.submit_responses(
+            survey_id=survey_id,
+            submissions=[
+                ResponseSubmission(
+                    respondent_id=respondent_id,
+                    answers={rating_q: str(rating), choice_q: choice},
+                )
+                for respondent_id, rating, choice in zip(respondent_ids, _RATINGS, choices, strict=True)
+            ]
+        )
 
         results = survey_commands.get_results(survey_id)
 
-        assert results[rating_q]["count"] == 10
-        expected_avg = (5 + 4 + 5 + 3 + 4 + 5 + 4 + 5 + 3 + 4) / 10
-        assert results[rating_q]["average"] == expected_avg
+        assert results[rating_q]["count"] == len(_RATINGS)
+        assert results[rating_q]["average"] == pytest.approx(_RATING_AVG, abs=0.005)
 
-        assert results[choice_q]["count"] == 10
+        assert results[choice_q]["count"] == len(choices)
         assert results[choice_q]["distribution"]["오전"] == 5
         assert results[choice_q]["distribution"]["오후"] == 3
         assert results[choice_q]["distribution"]["저녁"] == 2
@@ -203,69 +237,55 @@ class TestScenario03:
 class TestScenario04:
     """시나리오 4: 에러 케이스 테스트"""
 
-    def test_invalid_survey_id(self, survey_commands):
-        """존재하지 않는 설문 ID로 조회 시 에러가 발생하는지 테스트합니다.
+    @pytest.mark.parametrize(
+        ("action", "match"),
+        [
+            (
+                lambda commands: commands.get_survey("invalid_survey_id"),
+                _NOT_FOUND,
+            ),
+            (
+                lambda commands: commands.add_question(
+                    survey_id="nonexistent_id", text="테스트 질문", question_type="text"
+                ),
+                _NOT_FOUND,
+            ),
+            (
+                lambda commands: commands.add_question(
+                    survey_id="nonexistent_id", text="테스트 질문", question_type="invalid_type"
+                ),
+                _UNSUPPORTED_TYPE,
+            ),
+        ],
+        ids=["invalid_survey_id", "add_question_to_nonexistent_survey", "invalid_question_type"],
+    )
+    def test_error_cases(self, survey_commands, action, match):
+        """잘못된 입력에 대해 원인에 맞는 에러가 발생하는지 테스트합니다.
 
         Args:
             survey_commands: SurveyCommands 픽스처
+            action: SurveyCommands로 잘못된 요청을 보내는 함수
+            match: 기대하는 에러 메시지 패턴 (미리 컴파일됨)
 
         시나리오:
             1. 존재하지 않는 설문 ID로 조회 시도
-            2. ValueError 발생 확인
-        """
-        with pytest.raises(ValueError, match="설문을 찾을 수 없습니다"):
-            survey_commands.get_survey("invalid_survey_id")
-
-    def test_add_question_to_nonexistent_survey(self, survey_commands):
-        """존재하지 않는 설문에 질문 추가 시 에러가 발생하는지 테스트합니다.
-
-        Args:
-            survey_commands: SurveyCommands 픽스처
-
-        시나리오:
-            1. 존재하지 않는 설문 ID에 질문 추가 시도
-            2. ValueError 발생 확인
-        """
-        with pytest.raises(ValueError, match="설문을 찾을 수 없습니다"):
-            survey_commands.add_question(
-                survey_id="nonexistent_id",
-                text="테스트 질문",
-                question_type="text"
-            )
-
-    def test_invalid_question_type(self, survey_commands):
-        """잘못된 질문 유형으로 질문 추가 시 에러가 발생하는지 테스트합니다.
-
-        Args:
-            survey_commands: SurveyCommands 픽스처
-
-        시나리오:
-            1. 설문 생성
-            2. 잘못된 질문 유형으로 질문 추가 시도
-            3. ValueError 발생 확인
+            2. 존재하지 않는 설문에 질문 추가 시도
+            3. 잘못된 질문 유형으로 질문 추가 시도 (설문 확인 전에 유형 검증)
+            4. 각 경우 ValueError와 에러 메시지 확인
         """
-        survey_id = survey_commands.create_survey(
-            title="에러 테스트",
-            description="에러 케이스 확인"
-        )
-
-        with pytest.raises(ValueError):
-            survey_commands.add_question(
-                survey_id=survey_id,
-                text="테스트 질문",
-                question_type="invalid_type"
-            )
+        with pytest.raises(ValueError, match=match):
+            action(survey_commands)
 
 
 class TestScenario05:
     """시나리오 5: CSV 영속성 테스트"""
 
-    def test_data_persistence(self, survey_commands, temp_data_dir):
+    def test_data_persistence(self, survey_commands, csv_paths):
         """데이터가 CSV 파일에 올바르게 저장되고 조회되는지 테스트합니다.
 
         Args:
             survey_commands: SurveyCommands 픽스처
-            temp_data_dir: 임시 데이터 디렉토리 픽스처
+            csv_paths: CSV 파일 경로 픽스처
 
         시나리오:
             1. 설문 생성 및 질문 추가
@@ -284,28 +304,23 @@ class TestScenario05:
             question_type="rating"
         )
 
-        surveys_csv = temp_data_dir / "surveys.csv"
-        questions_csv = temp_data_dir / "questions.csv"
-        responses_csv = temp_data_dir / "responses.csv"
-
-        assert surveys_csv.exists()
-        assert questions_csv.exists()
-        assert responses_csv.exists()
-
-        with open(surveys_csv, "r", encoding="utf-8-sig") as f:
-            reader = csv.DictReader(f)
-            rows = list(reader)
-            assert len(rows) == 1
-            assert rows[0]["id"] == survey_id
-            assert rows[0]["title"] == "영속성 테스트"
-
-        with open(questions_csv, "r", encoding="utf-8-sig") as f:
-            reader = csv.DictReader(f)
-            rows = list(reader)
-            assert len(rows) == 1
-            assert rows[0]["id"] == q1_id
-            assert rows[0]["survey_id"] == survey_id
-            assert rows[0]["text"] == "테스트 질문"
+        stored_files = {entry.name for entry in os.scandir(csv_paths.root)}
+        assert {
+            csv_paths.surveys_csv.name,
+            csv_paths.questions_csv.name,
+            csv_paths.responses_csv.name,
+        } <= stored_files
+
+        rows = _read_csv(csv_paths.surveys_csv)
+        assert len(rows) == 1
+        assert rows[0]["id"] == survey_id
+        assert rows[0]["title"] == "영속성 테스트"
+
+        rows = _read_csv(csv_paths.questions_csv)
+        assert len(rows) == 1
+        assert rows[0]["id"] == q1_id
+        assert rows[0]["survey_id"] == survey_id
+        assert rows[0]["text"] == "테스트 질문"
 
         survey_commands.submit_response(
             survey_id=survey_id,
@@ -313,50 +328,491 @@ class TestScenario05:
             answers={q1_id: "5"}
         )
 
-        with open(responses_csv, "r", encoding="utf-8-sig") as f:
-            reader = csv.DictReader(f)
-            rows = list(reader)
-            assert len(rows) == 1
-            assert rows[0]["survey_id"] == survey_id
-            assert rows[0]["question_id"] == q1_id
-            assert rows[0]["answer"] == "5"
-            assert rows[0]["respondent_id"] == "test_patient"
+        rows = _read_csv(csv_paths.responses_csv)
+        assert len(rows) == 1
+        assert rows[0]["survey_id"] == survey_id
+        assert rows[0]["question_id"] == q1_id
+        assert rows[0]["answer"] == "5"
+        assert rows[0]["respondent_id"] == "test_patient"
 
-    def test_multiple_surveys_persistence(self, survey_commands, temp_data_dir):
+    def test_multiple_surveys_persistence(self, survey_commands, csv_paths):
         """여러 설문이 CSV에 올바르게 저장되는지 테스트합니다.
 
         Args:
             survey_commands: SurveyCommands 픽스처
-            temp_data_dir: 임시 데이터 디렉토리 픽스처
+            csv_paths: CSV 파일 경로 픽스처
 
         시나리오:
-            1. 3개의 설문 생성
-            2. 각 설문에 질문 추가
-            3. CSV 파일에 모든 데이터가 저장되었는지 확인
+            1. 3개의 설문을 한 번에 생성
+            2. 각 설문에 질문을 하나씩 추가
+            3. CSV 파일에 모든 설문과 질문 행이 저장되었는지 확인
             4. 설문 목록 조회로 검증
         """
-        survey_ids = []
-        for i in range(3):
-            survey_id = survey_commands.create_survey(
-                title=f"설문 {i+1}",
-                description=f"테스트 설문 {i+1}"
-            )
-            survey_ids.append(survey_id)
-
+        survey_ids = survey_commands.create_surveys(
+            [SurveySpec(title=f"설문 {i+1}", description=f"테스트 설문 {i+1}") for i in range(3)]
+        )
+        for i, survey_id in enumerate(survey_ids):
             survey_commands.add_question(
                 survey_id=survey_id,
                 text=f"질문 {i+1}",
                 question_type="text"
             )
 
-        surveys_csv = temp_data_dir / "surveys.csv"
-        with open(surveys_csv, "r", encoding="utf-8-sig") as f:
-            reader = csv.DictReader(f)
-            rows = list(reader)
-            assert len(rows) == 3
+        assert _count_csv_rows(csv_paths.surveys_csv) == 3
+        assert _count_csv_rows(csv_paths.questions_csv) == 3
 
         all_surveys = survey_commands.list_surveys()
         assert len(all_surveys) == 3
         stored_ids = [s["id"] for s in all_surveys]
         for survey_id in survey_ids:
             assert survey_id in stored_ids
+
+
+class TestScenario06:
+    """시나리오 6: 캐시 갱신 테스트"""
+
+    def test_results_refresh_after_new_response(self, survey_commands):
+        """결과를 조회한 뒤 새 응답이 제출되면 갱신된 결과가 조회되는지 테스트합니다.
+
+        Args:
+            survey_commands: SurveyCommands 픽스처
+
+        시나리오:
+            1. 설문 생성 및 질문 추가
+            2. 응답 1건 제출 후 결과 조회
+            3. 응답 1건 추가 제출 후 결과 재조회
+            4. 추가 응답이 반영되었는지 검증
+        """
+        survey_id = survey_commands.create_survey(
+            title="캐시 테스트",
+            description="결과 캐시 갱신 확인"
+        )
+        rating_q = survey_commands.add_question(
+            survey_id=survey_id,
+            text="만족도를 평가해주세요",
+            question_type="rating"
+        )
+
+        survey_commands.submit_response(survey_id, "patient_001", {rating_q: "5"})
+        first = survey_commands.get_results(survey_id)
+        assert first[rating_q]["count"] == 1
+
+        survey_commands.submit_response(survey_id, "patient_002", {rating_q: "3"})
+        second = survey_commands.get_results(survey_id)
+        assert second[rating_q]["count"] == 2
+        assert second[rating_q]["average"] == 4.0
+
+    def test_results_isolated_from_caller_mutation(self, survey_commands):
+        """조회한 결과를 호출하는 쪽에서 수정해도 캐시된 결과가 바뀌지 않는지 테스트합니다.
+
+        Args:
+            survey_commands: SurveyCommands 픽스처
+
+        시나리오:
+            1. 설문 생성, 질문 추가, 응답 제출
+            2. 결과를 조회한 뒤 분포, 답변 목록, 통계 값을 직접 수정
+            3. 결과 재조회 시 캐시된 원래 값이 그대로인지 검증
+        """
+        survey_id = survey_commands.create_survey(
+            title="캐시 격리 테스트",
+            description="결과 수정 격리 확인"
+        )
+        choice_q, text_q = survey_commands.add_questions(
+            survey_id=survey_id,
+            specs=[
+                QuestionSpec(
+                    text="선호하는 진료 시간대는?",
+                    question_type=QuestionType.MULTIPLE_CHOICE,
+                    options=("오전", "오후"),
+                ),
+                QuestionSpec(text="의견을 작성해주세요", question_type=QuestionType.TEXT),
+            ]
+        )
+        survey_commands.submit_response(survey_id, "patient_001", {choice_q: "오전", text_q: "좋아요"})
+
+        first = survey_commands.get_results(survey_id)
+        first[choice_q]["distribution"]["오전"] = 100
+        first[choice_q]["count"] = 100
+        first[text_q]["answers"].append("변조된 답변")
+
+        second = survey_commands.get_results(survey_id)
+        assert second[choice_q]["distribution"] == {"오전": 1}
+        assert second[choice_q]["count"] == 1
+        assert second[text_q]["answers"] == ["좋아요"]
+
+    def test_results_refresh_after_external_write(self, survey_commands, temp_data_dir):
+        """다른 인스턴스가 같은 CSV에 응답을 저장해도 갱신된 결과가 조회되는지 테스트합니다.
+
+        Args:
+            survey_commands: SurveyCommands 픽스처
+            temp_data_dir: 임시 데이터 디렉토리 픽스처
+
+        시나리오:
+            1. 설문 생성, 질문 추가, 결과 조회로 캐시 생성
+            2. 같은 데이터 디렉토리를 쓰는 다른 SurveyCommands로 응답 제출
+            3. 기존 인스턴스의 결과 재조회 시 응답이 반영되었는지 검증
+        """
+        survey_id = survey_commands.create_survey(
+            title="외부 변경 테스트",
+            description="다른 프로세스 쓰기 확인"
+        )
+        choice_q = survey_commands.add_question(
+            survey_id=survey_id,
+            text="선호하는 진료 시간대는?",
+            question_type="choice",
+            options=["오전", "오후"]
+        )
+        assert survey_commands.get_results(survey_id)[choice_q]["count"] == 0
+
+        other_commands = SurveyCommands(temp_data_dir)
+        other_commands.submit_response(survey_id, "patient_001", {choice_q: "오후"})
+
+        results = survey_commands.get_results(survey_id)
+        assert results[choice_q]["count"] == 1
+        assert results[choice_q]["distribution"]["오후"] == 1
+
+    def test_results_include_response_written_during_save(self, survey_commands, temp_data_dir, monkeypatch):
+        """응답을 저장하는 사이 다른 인스턴스가 쓴 응답도 결과에 반영되는지 테스트합니다.
+
+        Args:
+            survey_commands: SurveyCommands 픽스처
+            temp_data_dir: 임시 데이터 디렉토리 픽스처
+            monkeypatch: pytest monkeypatch 픽스처
+
+        시나리오:
+            1. 설문 생성 및 질문 추가
+            2. 인덱스 확인 직후, 파일에 쓰기 직전에 다른 인스턴스가 응답을 저장하도록 설정
+            3. 응답 제출 후 결과 조회
+            4. 두 응답이 모두 집계되었는지 검증
+        """
+        survey_id = survey_commands.create_survey(
+            title="동시 쓰기 테스트",
+            description="저장 중 외부 쓰기 확인"
+        )
+        rating_q = survey_commands.add_question(
+            survey_id=survey_id,
+            text="만족도를 평가해주세요",
+            question_type="rating"
+        )
+
+        other_commands = SurveyCommands(temp_data_dir)
+        repository = survey_commands.response_service.response_repository
+        refresh_index = repository._refresh_index
+        injected = []
+
+        def refresh_then_write_externally() -> None:
+            refresh_index()
+            if not injected:
+                injected.append(True)
+                other_commands.submit_response(survey_id, "external", {rating_q: "1"})
+
+        monkeypatch.setattr(repository, "_refresh_index", refresh_then_write_externally)
+        survey_commands.submit_response(survey_id, "mine", {rating_q: "5"})
+
+        results = survey_commands.get_results(survey_id)
+        assert results[rating_q]["count"] == 2
+        assert results[rating_q]["average"] == 3.0
+
+    @pytest.mark.parametrize(
+        ("external_values", "expected_values"),
+        [((), ["내 행"]), (("외부 행",), ["외부 행", "내 행"])],
+        ids=["sole_writer", "concurrent_writer"],
+    )
+    def test_append_rows_signature(self, tmp_path, external_values, expected_values):
+        """append_rows가 다른 쓰기가 끼어든 경우에만 인덱스 서명을 무효화하는지 테스트합니다.
+
+        Args:
+            tmp_path: pytest 임시 경로 픽스처
+            external_values: 인덱스 확인 뒤 다른 프로세스가 먼저 추가하는 행 값
+            expected_values: 최종 파일에 기대하는 행 값 순서
+
+        시나리오:
+            1. 헤더만 있는 CSV 파일 생성 후 서명 기록
+            2. 필요하면 다른 프로세스처럼 행을 먼저 추가
+            3. append_rows로 멀티바이트 행 추가
+            4. 단독 쓰기면 현재 서명, 끼어든 쓰기가 있으면 (-1, -1)인지 검증
+        """
+        path = tmp_path / "rows.csv"
+        with open_csv(path, "w") as f:
+            csv.writer(f).writerow(("value",))
+        indexed_signature = file_signature(path)
+
+        if external_values:
+            with open_csv(path, "a") as f:
+                csv.writer(f).writerow(external_values)
+
+        signature = append_rows(path, [("내 행",)], indexed_signature)
+
+        assert signature == (file_signature(path) if not external_values else (-1, -1))
+        assert [row["value"] for row in _read_csv(path)] == expected_values
+
+    def test_surveys_refresh_after_external_write(self, survey_commands, temp_data_dir):
+        """다른 인스턴스가 같은 CSV에 설문과 질문을 저장해도 조회 결과에 반영되는지 테스트합니다.
+
+        Args:
+            survey_commands: SurveyCommands 픽스처
+            temp_data_dir: 임시 데이터 디렉토리 픽스처
+
+        시나리오:
+            1. 설문 1개 생성 후 목록 조회로 인덱스 생성
+            2. 같은 데이터 디렉토리를 쓰는 다른 SurveyCommands로 설문과 질문 추가
+            3. 기존 인스턴스의 목록과 설문 상세에 추가 내용이 반영되었는지 검증
+        """
+        survey_commands.create_survey(title="기존 설문", description="인덱스 생성용")
+        assert len(survey_commands.list_surveys()) == 1
+
+        other_commands = SurveyCommands(temp_data_dir)
+        survey_id = other_commands.create_survey(title="외부 설문", description="다른 인스턴스에서 생성")
+        other_commands.add_question(survey_id=survey_id, text="외부 질문", question_type="text")
+
+        assert len(survey_commands.list_surveys()) == 2
+        survey_data = survey_commands.get_survey(survey_id)
+        assert survey_data["questions"][0]["text"] == "외부 질문"
+
+    def test_surveys_include_survey_written_during_save(self, survey_commands, temp_data_dir, monkeypatch):
+        """설문을 저장하는 사이 다른 인스턴스가 쓴 설문도 조회에 반영되는지 테스트합니다.
+
+        Args:
+            survey_commands: SurveyCommands 픽스처
+            temp_data_dir: 임시 데이터 디렉토리 픽스처
+            monkeypatch: pytest monkeypatch 픽스처
+
+        시나리오:
+            1. 인덱스 확인 직후, 파일에 쓰기 직전에 다른 인스턴스가 설문을 저장하도록 설정
+            2. 설문 생성
+            3. 두 설문이 저장 순서대로 목록에 있는지 검증
+        """
+        other_commands = SurveyCommands(temp_data_dir)
+        repository = survey_commands.survey_service.survey_repository
+        refresh_index = repository._refresh_index
+        external_ids = []
+
+        def refresh_then_write_externally() -> None:
+            refresh_index()
+            if not external_ids:
+                external_ids.append(other_commands.create_survey(title="외부 설문", description="저장 중 생성"))
+
+        monkeypatch.setattr(repository, "_refresh_index", refresh_then_write_externally)
+        survey_commands.create_survey(title="내 설문", description="저장 대상")
+
+        assert [s["title"] for s in survey_commands.list_surveys()] == ["외부 설문", "내 설문"]
+        assert repository.exists_survey(external_ids[0])
+
+
+class TestScenario07:
+    """시나리오 7: 설문 목록 페이지네이션 테스트"""
+
+    def test_get_surveys_pages_in_order(self, survey_commands):
+        """설문 목록이 저장 순서대로 페이지 단위로 조회되는지 테스트합니다.
+
+        Args:
+            survey_commands: SurveyCommands 픽스처
+
+        시나리오:
+            1. 설문 3개 생성
+            2. 크기 2인 첫 페이지와 두 번째 페이지 조회
+            3. 각 페이지의 설문 ID 순서 검증
+        """
+        survey_ids = survey_commands.create_surveys(
+            [SurveySpec(title=f"설문 {i+1}", description="페이지 테스트") for i in range(3)]
+        )
+        service = survey_commands.survey_service
+
+        assert [s.id for s in service.get_surveys(0, 2).surveys] == survey_ids[:2]
+        assert [s.id for s in service.get_surveys(2, 2).surveys] == survey_ids[2:]
+
+    @pytest.mark.parametrize(
+        ("skip", "limit", "expected_count"),
+        [
+            (0, 1, 1),
+            (0, SurveyPageConfig.MAX_LIMIT, SurveyPageConfig.MAX_LIMIT),
+            (0, SurveyPageConfig.MAX_LIMIT + 1, SurveyPageConfig.MAX_LIMIT),
+            (SurveyPageConfig.MAX_LIMIT, SurveyPageConfig.MAX_LIMIT, 1),
+            (SurveyPageConfig.MAX_LIMIT + 1, 1, 0),
+            (SurveyPageConfig.MAX_LIMIT + 10, SurveyPageConfig.MAX_LIMIT, 0),
+        ],
+        ids=["min_limit", "max_limit", "limit_clamped", "last_page", "skip_at_end", "skip_past_end"],
+    )
+    def test_get_surveys_boundaries(self, survey_commands, skip, limit, expected_count):
+        """limit 경계, MAX_LIMIT 제한, 끝을 넘는 skip이 올바르게 처리되는지 테스트합니다.
+
+        Args:
+            survey_commands: SurveyCommands 픽스처
+            skip: 건너뛸 설문 수
+            limit: 조회할 최대 설문 수
+            expected_count: 기대하는 조회 설문 수
+
+        시나리오:
+            1. MAX_LIMIT보다 1개 많은 설문 생성
+            2. skip과 limit으로 페이지 조회
+            3. 조회된 설문 수와 전체 설문 수 검증
+        """
+        survey_commands.create_surveys(
+            [
+                SurveySpec(title=f"설문 {i+1}", description="경계 테스트")
+                for i in range(SurveyPageConfig.MAX_LIMIT + 1)
+            ]
+        )
+        page = survey_commands.survey_service.get_surveys(skip, limit)
+
+        assert len(page.surveys) == expected_count
+        assert page.total == SurveyPageConfig.MAX_LIMIT + 1
+
+    @pytest.mark.parametrize(
+        ("skip", "limit", "match"),
+        [
+            (-1, 1, "건너뛸 설문 수는 0 이상이어야 합니다: -1"),
+            (0, 0, "조회할 설문 수는 1 이상이어야 합니다: 0"),
+            (5, -3, "조회할 설문 수는 1 이상이어야 합니다: -3"),
+        ],
+        ids=["negative_skip", "zero_limit", "negative_limit"],
+    )
+    def test_get_surveys_invalid_arguments(self, survey_commands, skip, limit, match):
+        """음수 skip이나 1보다 작은 limit으로 조회하면 ValueError가 발생하는지 테스트합니다.
+
+        Args:
+            survey_commands: SurveyCommands 픽스처
+            skip: 건너뛸 설문 수
+            limit: 조회할 최대 설문 수
+            match: 기대하는 에러 메시지
+
+        시나리오:
+            1. 설문 1개 생성
+            2. 잘못된 skip 또는 limit으로 조회 시 ValueError와 에러 메시지 확인
+        """
+        survey_commands.create_survey(title="설문", description="오류 테스트")
+
+        with pytest.raises(ValueError, match=match):
+            survey_commands.survey_service.get_surveys(skip, limit)
+
+    def test_get_surveys_total(self, survey_commands):
+        """페이지와 함께 반환되는 전체 설문 수가 빈 저장소와 설문 추가 후 모두 올바른지 테스트합니다.
+
+        Args:
+            survey_commands: SurveyCommands 픽스처
+
+        시나리오:
+            1. 빈 저장소에서 빈 페이지와 전체 설문 수 0 확인
+            2. 설문 3개 생성 후 크기 1인 페이지의 전체 설문 수가 3인지 확인
+        """
+        service = survey_commands.survey_service
+        empty_page = service.get_surveys(0, 1)
+        assert empty_page.surveys == ()
+        assert empty_page.total == 0
+
+        survey_commands.create_surveys(
+            [SurveySpec(title=f"설문 {i+1}", description="개수 테스트") for i in range(3)]
+        )
+        assert service.get_surveys(0, 1).total == 3
+
+    @pytest.mark.parametrize(
+        ("skip", "limit", "expected_index"),
+        [(1, 1, [1]), (0, SurveyPageConfig.MAX_LIMIT + 1, [0, 1, 2]), (3, 1, [])],
+        ids=["middle_page", "limit_clamped", "skip_past_end"],
+    )
+    def test_list_surveys_endpoint_total(self, survey_commands, skip, limit, expected_index):
+        """GET /surveys 핸들러가 페이지와 상관없이 전체 설문 수를 total로 반환하는지 테스트합니다.
+
+        Args:
+            survey_commands: SurveyCommands 픽스처
+            skip: 건너뛸 설문 수
+            limit: 조회할 최대 설문 수
+            expected_index: 페이지에 포함될 설문의 생성 순서 인덱스
+
+        시나리오:
+            1. 설문 3개 생성
+            2. 목록 핸들러를 호출하고 SurveyListResponse로 검증
+            3. 페이지의 설문 ID와 total 검증
+        """
+        survey_ids = survey_commands.create_surveys(
+            [SurveySpec(title=f"설문 {i+1}", description="엔드포인트 테스트") for i in range(3)]
+        )
+
+        page = SurveyListResponse.model_validate(
+            list_surveys(skip=skip, limit=limit, service=survey_commands.survey_service)
+        )
+
+        assert [item.id for item in page.surveys] == [survey_ids[i] for i in expected_index]
+        assert page.total == 3
+
+
+class TestScenario08:
+    """시나리오 8: 저장된 엔티티 복원 테스트"""
+
+    def test_restore_entity(self):
+        """restore_entity로 복원한 엔티티가 생성자로 만든 엔티티와 같은지 테스트합니다.
+
+        시나리오:
+            1. 모든 필드 값으로 설문 엔티티 복원
+            2. 같은 값으로 생성한 엔티티와 비교
+        """
+        created_at = datetime(2024, 1, 1, 9, 0)
+        restored = restore_entity(
+            Survey, id="s1", title="설문", description="설명", created_at=created_at, questions=()
+        )
+
+        assert restored == Survey(id="s1", title="설문", description="설명", created_at=created_at)
+
+    @pytest.mark.parametrize(
+        ("values", "match"),
+        [
+            ({"id": "s1", "title": "설문"}, r"누락된 필드 \['created_at', 'description', 'questions'\]"),
+            (
+                {
+                    "id": "s1",
+                    "title": "설문",
+                    "description": "설명",
+                    "created_at": datetime(2024, 1, 1),
+                    "questions": (),
+                    "status": "open",
+                },
+                r"알 수 없는 필드 \['status'\]",
+            ),
+        ],
+        ids=["missing_field", "unknown_field"],
+    )
+    def test_restore_entity_rejects_field_mismatch(self, values, match):
+        """필드가 빠지거나 남으면 일부만 채워진 엔티티 대신 ValueError가 발생하는지 테스트합니다.
+
+        Args:
+            values: 복원에 사용할 필드 값
+            match: 기대하는 에러 메시지 패턴
+
+        시나리오:
+            1. 필드가 맞지 않는 값으로 설문 엔티티 복원 시도
+            2. ValueError와 에러 메시지 확인
+        """
+        with pytest.raises(ValueError, match=match):
+            restore_entity(Survey, **values)
+
+    @pytest.mark.parametrize(
+        ("restore", "match"),
+        [
+            (
+                lambda: Question.from_dict(
+                    {"id": "q1", "survey_id": "s1", "text": "질문", "question_type": "invalid", "options": ""}
+                ),
+                _UNSUPPORTED_TYPE,
+            ),
+            (
+                lambda: Survey.from_dict(
+                    {"id": "s1", "title": "설문", "description": "설명", "created_at": "not-a-date"}
+                ),
+                "Invalid isoformat string",
+            ),
+        ],
+        ids=["invalid_question_type", "invalid_created_at"],
+    )
+    def test_from_dict_rejects_invalid_value(self, restore, match):
+        """저장된 값이 올바르지 않으면 복원 시 ValueError가 발생하는지 테스트합니다.
+
+        Args:
+            restore: 잘못된 행으로 엔티티를 복원하는 함수
+            match: 기대하는 에러 메시지 패턴
+
+        시나리오:
+            1. 잘못된 질문 유형 또는 생성 일시로 엔티티 복원 시도
+            2. ValueError와 에러 메시지 확인
+        """
+        with pytest.raises(ValueError, match=match):
+            restore()